@@ -289,6 +289,22 @@ class LocalStore:
                 return
         raise ValueError(f"Harvest item not found: {item.id}")
 
+    def update_harvest_items(self, items: list[HarvestQueueItem]) -> None:
+        """Update several existing harvest queue items with a single save."""
+        by_id = {item.id: item for item in items}
+        queue = self._data["harvest_queue"]
+        found = set()
+        for i, q in enumerate(queue):
+            item = by_id.get(q["id"])
+            if item is not None:
+                queue[i] = item.to_dict()
+                found.add(item.id)
+        missing = by_id.keys() - found
+        if missing:
+            raise ValueError(f"Harvest item not found: {sorted(missing)[0]}")
+        if found:
+            self._save()
+
     def remove_harvest_item(self, item_id: str) -> None:
         """Remove a harvest queue item by ID."""
         queue = self._data["harvest_queue"]
@@ -5,6 +5,7 @@ with the UI layer, replacing the mock data factory.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
@@ -118,6 +119,11 @@ class Trade:
         )
 
 
+def _newest_first(trade: Trade) -> int:
+    """Sort key ordering trades by execution date, newest first."""
+    return -trade.executed_at.toordinal()
+
+
 @dataclass
 class TradeFilters:
     """Filters for trade history queries."""
@@ -248,23 +254,25 @@ class PortfolioService:
         """
         alpaca_orders = self._alpaca.get_order_history(days=days)
 
-        # Convert to Trade objects
+        # Convert to Trade objects, sorted by date descending
         trades = [Trade.from_alpaca(o) for o in alpaca_orders]
+        trades.sort(key=_newest_first)
 
         # Apply filters
         if filters:
+            # Trades are sorted, so the date range is a binary-searched slice
+            lo, hi = 0, len(trades)
+            if filters.end_date:
+                lo = bisect_left(trades, -filters.end_date.toordinal(), key=_newest_first)
+            if filters.start_date:
+                hi = bisect_right(trades, -filters.start_date.toordinal(), key=_newest_first)
+            trades = trades[lo:hi]
             if filters.ticker:
                 trades = [t for t in trades if t.ticker == filters.ticker]
             if filters.trade_type:
                 trades = [t for t in trades if t.trade_type == filters.trade_type]
-            if filters.start_date:
-                trades = [t for t in trades if t.executed_at >= filters.start_date]
-            if filters.end_date:
-                trades = [t for t in trades if t.executed_at <= filters.end_date]
             # Note: harvest_only filter would need harvest event tracking
 
-        # Sort by date descending
-        trades.sort(key=lambda t: t.executed_at, reverse=True)
         logger.debug(
             "get_trade_history: days=%d, filters=%s, returning %d trades",
             days, filters, len(trades),
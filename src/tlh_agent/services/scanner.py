@@ -268,6 +268,45 @@ class PortfolioScanner:
                 return
         raise ValueError(f"Queue item not found: {queue_id}")
 
+    def approve_harvests(self, queue_ids: list[str]) -> int:
+        """Approve several queued harvests, saving the store once.
+
+        Args:
+            queue_ids: IDs of the queue items to approve.
+
+        Returns:
+            Number of items approved.
+        """
+        return self._set_harvest_status(queue_ids, "approved")
+
+    def reject_harvests(self, queue_ids: list[str]) -> int:
+        """Reject several queued harvests, saving the store once.
+
+        Args:
+            queue_ids: IDs of the queue items to reject.
+
+        Returns:
+            Number of items rejected.
+        """
+        return self._set_harvest_status(queue_ids, "rejected")
+
+    def _set_harvest_status(self, queue_ids: list[str], status: str) -> int:
+        """Set the status of several queue items in one store update."""
+        if not queue_ids:
+            return 0
+
+        wanted = set(queue_ids)
+        items = [item for item in self._store.get_harvest_queue() if item.id in wanted]
+        missing = wanted - {item.id for item in items}
+        if missing:
+            raise ValueError(f"Queue item not found: {sorted(missing)[0]}")
+
+        for item in items:
+            item.status = status
+        self._store.update_harvest_items(items)
+        logger.info("Set %d harvests to %s", len(items), status)
+        return len(items)
+
     def get_pending_harvests(self) -> list[HarvestQueueItem]:
         """Get all pending harvest items.
 
@@ -7,6 +7,7 @@ Manages a unified queue of pending trades from multiple sources:
 """
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -75,6 +76,38 @@ class TradeQueueService:
     def __init__(self) -> None:
         """Initialize the trade queue service."""
         self._queue: dict[str, QueuedTrade] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked whenever the queue changes.
+
+        Callbacks run on the thread that changed the queue, so UI
+        listeners must marshal onto their own thread.
+
+        Args:
+            callback: Function called with no arguments after each change.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback added with add_listener.
+
+        Args:
+            callback: The callback to remove.
+        """
+        self._listeners.remove(callback)
+
+    def _notify(self) -> None:
+        """Invoke all change listeners.
+
+        A failing listener is logged and skipped so it cannot abort the
+        queue change or starve the listeners after it.
+        """
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception:
+                logger.exception("Trade queue listener failed")
 
     def add_trade(
         self,
@@ -130,6 +163,7 @@ class TradeQueueService:
             "Added trade: %s %s %s x%.3f shares",
             trade_type.value, action.value, symbol, shares,
         )
+        self._notify()
         return trade
 
     def get_all_trades(self) -> list[QueuedTrade]:
@@ -194,6 +228,7 @@ class TradeQueueService:
         if trade and trade.status == TradeStatus.PENDING:
             trade.status = TradeStatus.APPROVED
             logger.info("Approved trade %s (%s)", trade_id, trade.symbol)
+            self._notify()
             return True
         return False
 
@@ -210,6 +245,7 @@ class TradeQueueService:
         if trade and trade.status == TradeStatus.PENDING:
             trade.status = TradeStatus.REJECTED
             logger.info("Rejected trade %s (%s)", trade_id, trade.symbol)
+            self._notify()
             return True
         return False
 
@@ -228,6 +264,8 @@ class TradeQueueService:
                 trade.status = TradeStatus.APPROVED
                 count += 1
         logger.info("Approved all: %d trades", count)
+        if count:
+            self._notify()
         return count
 
     def reject_all(self, trade_type: TradeType | None = None) -> int:
@@ -244,6 +282,8 @@ class TradeQueueService:
             if trade_type is None or trade.trade_type == trade_type:
                 trade.status = TradeStatus.REJECTED
                 count += 1
+        if count:
+            self._notify()
         return count
 
     def mark_executed(
@@ -266,6 +306,7 @@ class TradeQueueService:
             trade.executed_at = datetime.now()
             trade.fill_price = fill_price
             logger.info("Executed trade %s (%s) at $%.2f", trade_id, trade.symbol, fill_price)
+            self._notify()
             return True
         return False
 
@@ -285,6 +326,7 @@ class TradeQueueService:
             if error:
                 trade.reason = f"{trade.reason} - Failed: {error}"
             logger.info("Failed trade %s (%s): %s", trade_id, trade.symbol, error or "unknown")
+            self._notify()
             return True
         return False
 
@@ -299,6 +341,7 @@ class TradeQueueService:
         """
         if trade_id in self._queue:
             del self._queue[trade_id]
+            self._notify()
             return True
         return False
 
@@ -307,6 +350,8 @@ class TradeQueueService:
         count = len(self._queue)
         self._queue.clear()
         logger.info("Cleared queue: %d trades removed", count)
+        if count:
+            self._notify()
 
     def get_summary(self) -> dict[str, int]:
         """Get summary counts by status.
@@ -0,0 +1,45 @@
+"""Run blocking work off the Tk event loop."""
+
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future
+
+
+def run_in_background[T](
+    widget: tk.Misc,
+    func: Callable[[], T],
+    on_done: Callable[[Future[T]], None],
+    poll_ms: int = 50,
+) -> Future[T]:
+    """Run a function on a worker thread and report back on the Tk thread.
+
+    The worker never touches Tk; completion is detected by polling from
+    the widget's event loop, and ``on_done`` is called there.
+
+    Args:
+        widget: Widget whose event loop polls for completion.
+        func: Work to run off the UI thread.
+        on_done: Called on the Tk thread with the finished future.
+        poll_ms: Polling interval in milliseconds.
+
+    Returns:
+        Future for the background work.
+    """
+    future: Future[T] = Future()
+
+    def worker() -> None:
+        try:
+            future.set_result(func())
+        except Exception as e:
+            future.set_exception(e)
+
+    def poll() -> None:
+        if future.done():
+            on_done(future)
+        else:
+            widget.after(poll_ms, poll)
+
+    threading.Thread(target=worker, daemon=True).start()
+    widget.after(poll_ms, poll)
+    return future
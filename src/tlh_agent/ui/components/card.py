@@ -24,23 +24,22 @@ class Card(tk.Frame):
             title: Optional title displayed at top of card.
             padding: Internal padding (default: Spacing.MD).
         """
-        # Outer frame provides the border
+        # The frame's highlight ring draws the 1px border, so no separate
+        # border frame is needed
         super().__init__(
             parent,
-            bg=Colors.BORDER_LIGHT,
-            highlightthickness=0,
+            bg=Colors.BG_SECONDARY,
+            highlightthickness=1,
+            highlightbackground=Colors.BORDER_LIGHT,
+            highlightcolor=Colors.BORDER_LIGHT,
         )
 
-        # Inner frame is the actual content area (2px border for visibility)
-        self._inner = tk.Frame(self, bg=Colors.BG_SECONDARY)
-        self._inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
-
         # Content frame with padding
-        self._content = tk.Frame(self._inner, bg=Colors.BG_SECONDARY)
+        self._content = tk.Frame(self, bg=Colors.BG_SECONDARY)
 
         if title:
             # Header section
-            self._header = tk.Frame(self._inner, bg=Colors.BG_SECONDARY)
+            self._header = tk.Frame(self, bg=Colors.BG_SECONDARY)
             self._header.pack(fill=tk.X, padx=padding, pady=(padding, Spacing.SM))
 
             self._title_label = tk.Label(
@@ -54,7 +53,7 @@ class Card(tk.Frame):
             self._title_label.pack(side=tk.LEFT, fill=tk.X)
 
             # Separator line under header
-            separator = tk.Frame(self._inner, bg=Colors.BORDER, height=1)
+            separator = tk.Frame(self, bg=Colors.BORDER, height=1)
             separator.pack(fill=tk.X, padx=padding)
 
             self._content.pack(fill=tk.BOTH, expand=True, padx=padding, pady=padding)
@@ -113,14 +112,16 @@ class MetricCard(tk.Frame):
             value: The metric value.
             trend: Optional trend indicator (e.g., "+5.2%").
         """
-        # Outer border frame (lighter for visibility)
-        super().__init__(parent, bg=Colors.BORDER_LIGHT)
-
-        # Inner content
-        inner = tk.Frame(self, bg=Colors.BG_SECONDARY)
-        inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        # Highlight ring draws the border (lighter for visibility)
+        super().__init__(
+            parent,
+            bg=Colors.BG_SECONDARY,
+            highlightthickness=1,
+            highlightbackground=Colors.BORDER_LIGHT,
+            highlightcolor=Colors.BORDER_LIGHT,
+        )
 
-        content = tk.Frame(inner, bg=Colors.BG_SECONDARY)
+        content = tk.Frame(self, bg=Colors.BG_SECONDARY)
         content.pack(fill=tk.BOTH, expand=True, padx=Spacing.MD, pady=Spacing.MD)
 
         # Label
@@ -1,7 +1,7 @@
 """Reusable data table component with sorting and selection."""
 
 import tkinter as tk
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from tkinter import ttk
 from typing import Any, Literal
@@ -34,6 +34,7 @@ class DataTable(ttk.Frame):
         on_select: Callable[[dict[str, Any]], None] | None = None,
         on_double_click: Callable[[dict[str, Any]], None] | None = None,
         show_header: bool = True,
+        row_key: str | None = None,
     ) -> None:
         """Initialize the data table.
 
@@ -43,13 +44,19 @@ class DataTable(ttk.Frame):
             on_select: Callback when a row is selected.
             on_double_click: Callback when a row is double-clicked.
             show_header: Whether to show the header row.
+            row_key: Row field that uniquely identifies each row. Required
+                for insert_row/update_row/delete_row.
         """
         super().__init__(parent, style="TFrame")
 
         self._columns = columns
         self._on_select = on_select
         self._on_double_click = on_double_click
+        self._row_key = row_key
         self._data: list[dict[str, Any]] = []
+        self._rows_by_item: dict[str, dict[str, Any]] = {}
+        self._item_order: list[str] = []  # All item ids in display order
+        self._hidden_rows: set[int] = set()  # id() of rows detached from view
         self._sort_column: str | None = None
         self._sort_ascending: bool = True
 
@@ -122,41 +129,147 @@ class DataTable(ttk.Frame):
             data: List of row data dictionaries.
         """
         self._data = data
+        self._hidden_rows = set()
         self._refresh_display()
 
-    def _refresh_display(self) -> None:
-        """Refresh the displayed data."""
-        # Clear existing items
-        for item in self._tree.get_children():
-            self._tree.delete(item)
+    def set_visible_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Show only the given rows, detaching the rest instead of deleting them.
+
+        No Treeview items are created or destroyed, so repeatedly filtering
+        the same data is much cheaper than calling set_data.
+
+        Args:
+            rows: Rows from the current data to show.
+        """
+        shown = {id(row) for row in rows}
+        self._hidden_rows = {id(row) for row in self._data if id(row) not in shown}
+        self._show_items()
+
+    def insert_row(self, row: dict[str, Any]) -> None:
+        """Add a single row without rebuilding the table.
 
-        # Sort if needed
+        Args:
+            row: Row data dictionary containing the row key.
+        """
+        item_id = self._item_id(row)
+        self._data.append(row)
+        self._rows_by_item[item_id] = row
+        self._item_order.append(item_id)
+        self._tree.insert(
+            "",
+            tk.END,
+            iid=item_id,
+            values=self._row_values(row),
+            tags=self._row_tags(row, len(self._data) - 1),
+        )
+        self._apply_sort_order()
+
+    def update_row(self, row: dict[str, Any]) -> None:
+        """Replace a single row in place, matched by its row key.
+
+        Args:
+            row: New row data dictionary containing the row key.
+        """
+        item_id = self._item_id(row)
+        old = self._rows_by_item[item_id]
+        self._data[self._data_index(old)] = row
+        self._rows_by_item[item_id] = row
+        self._tree.item(
+            item_id,
+            values=self._row_values(row),
+            tags=self._row_tags(row, self._tree.index(item_id)),
+        )
+        self._apply_sort_order()
+
+    def delete_row(self, key: Any) -> None:
+        """Remove a single row by its row key value.
+
+        Args:
+            key: Value of the row key field for the row to remove.
+        """
+        item_id = str(key)
+        row = self._rows_by_item.pop(item_id)
+        del self._data[self._data_index(row)]
+        self._item_order.remove(item_id)
+        self._hidden_rows.discard(id(row))
+        self._tree.delete(item_id)
+
+    def _item_id(self, row: dict[str, Any]) -> str:
+        """Get the Treeview item id for a keyed row."""
+        if self._row_key is None:
+            raise ValueError("DataTable needs a row_key for per-row updates")
+        return str(row[self._row_key])
+
+    def _data_index(self, row: dict[str, Any]) -> int:
+        """Find a row object in the data list by identity."""
+        return next(i for i, r in enumerate(self._data) if r is row)
+
+    def _row_values(self, row: dict[str, Any]) -> list[Any]:
+        """Build the displayed column values for a row."""
+        values = []
+        for col in self._columns:
+            value = row.get(col.key, "")
+            if col.formatter:
+                value = col.formatter(value)
+            values.append(value)
+        return values
+
+    def _row_tags(self, row: dict[str, Any], index: int) -> tuple[str, ...]:
+        """Determine the row tag from its data or position."""
+        if "tag" in row:
+            return (row["tag"],)
+        if index % 2 == 1:
+            return ("striped",)
+        return ()
+
+    def _sorted_data(self) -> list[dict[str, Any]]:
+        """Get the data in current display order."""
         display_data = self._data.copy()
         if self._sort_column:
             display_data.sort(
                 key=lambda row: self._sort_key(row.get(self._sort_column, "")),
                 reverse=not self._sort_ascending,
             )
+        return display_data
+
+    def _apply_sort_order(self) -> None:
+        """Move existing items into sorted order without re-inserting them."""
+        if not self._sort_column:
+            return
+        self._item_order = [self._item_id(row) for row in self._sorted_data()]
+        self._show_items()
+
+    def _show_items(self) -> None:
+        """Attach visible items in display order and detach hidden ones."""
+        hidden = self._hidden_rows
+        rows_by_item = self._rows_by_item
+        self._tree.set_children(
+            "", *(item for item in self._item_order if id(rows_by_item[item]) not in hidden)
+        )
+
+    def _refresh_display(self) -> None:
+        """Refresh the displayed data."""
+        # Clear existing items in a single Tcl call, including detached ones
+        self._tree.delete(*self._item_order)
+        self._rows_by_item = {}
+        self._item_order = []
+
+        # Insert rows (Tk redraws once at idle, not per insert)
+        insert = self._tree.insert
+        for i, row in enumerate(self._sorted_data()):
+            item_id = insert(
+                "",
+                tk.END,
+                iid=self._item_id(row) if self._row_key else None,
+                values=self._row_values(row),
+                tags=self._row_tags(row, i),
+            )
+            self._rows_by_item[item_id] = row
+            self._item_order.append(item_id)
 
-        # Insert rows
-        for i, row in enumerate(display_data):
-            values = []
-            for col in self._columns:
-                value = row.get(col.key, "")
-                if col.formatter:
-                    value = col.formatter(value)
-                values.append(value)
-
-            # Determine row tag
-            tags: tuple[str, ...] = ()
-            if "tag" in row:
-                tags = (row["tag"],)
-            elif i % 2 == 1:
-                tags = ("striped",)
-
-            # Store original row data in item
-            item_id = self._tree.insert("", tk.END, values=values, tags=tags)
-            self._tree.set(item_id, self._columns[0].key, values[0])
+        # Keep rows hidden by set_visible_rows out of view
+        if self._hidden_rows:
+            self._show_items()
 
         # Update header sort indicators
         self._update_sort_indicators()
@@ -215,10 +328,9 @@ class DataTable(ttk.Frame):
 
         selection = self._tree.selection()
         if selection:
-            item = selection[0]
-            index = self._tree.index(item)
-            if 0 <= index < len(self._data):
-                self._on_select(self._data[index])
+            row = self._rows_by_item.get(selection[0])
+            if row is not None:
+                self._on_select(row)
 
     def _handle_double_click(self, event: tk.Event) -> None:  # type: ignore[type-arg]
         """Handle row double-click event."""
@@ -227,10 +339,9 @@ class DataTable(ttk.Frame):
 
         selection = self._tree.selection()
         if selection:
-            item = selection[0]
-            index = self._tree.index(item)
-            if 0 <= index < len(self._data):
-                self._on_double_click(self._data[index])
+            row = self._rows_by_item.get(selection[0])
+            if row is not None:
+                self._on_double_click(row)
 
     def _handle_motion(self, event: tk.Event) -> None:  # type: ignore[type-arg]
         """Handle mouse motion for hover effect."""
@@ -279,10 +390,7 @@ class DataTable(ttk.Frame):
         """
         selection = self._tree.selection()
         if selection:
-            item = selection[0]
-            index = self._tree.index(item)
-            if 0 <= index < len(self._data):
-                return self._data[index]
+            return self._rows_by_item.get(selection[0])
         return None
 
     def clear_selection(self) -> None:
@@ -0,0 +1,79 @@
+"""Summary bar component showing a row of labelled metric values."""
+
+import tkinter as tk
+
+from tlh_agent.ui.theme import Colors, Fonts, Spacing
+
+
+class SummaryBar(tk.Frame):
+    """A horizontal row of caption/value pairs for summary metrics.
+
+    The value labels are created once and updated in place on refresh;
+    updates that would not change a label are skipped.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        specs: list[tuple[str, str]],
+        initial: str = "0",
+    ) -> None:
+        """Initialize the summary bar.
+
+        Args:
+            parent: The parent widget.
+            specs: (key, caption) pairs, one per metric, in display order.
+            initial: Text shown in each value label until first update.
+        """
+        super().__init__(parent, bg=Colors.BG_SECONDARY)
+
+        self._values: dict[str, tk.Label] = {}
+        # Text and color each value label currently shows
+        self._shown: dict[str, tuple[str, str]] = {}
+        for key, caption in specs:
+            frame = tk.Frame(self, bg=Colors.BG_SECONDARY)
+            frame.pack(side=tk.LEFT, padx=(0, Spacing.XL))
+
+            tk.Label(
+                frame,
+                text=caption,
+                font=Fonts.CAPTION,
+                fg=Colors.TEXT_MUTED,
+                bg=Colors.BG_SECONDARY,
+            ).pack(anchor=tk.W)
+
+            value_label = tk.Label(
+                frame,
+                text=initial,
+                font=Fonts.BODY_BOLD,
+                fg=Colors.TEXT_PRIMARY,
+                bg=Colors.BG_SECONDARY,
+            )
+            value_label.pack(anchor=tk.W)
+            self._values[key] = value_label
+            self._shown[key] = (initial, Colors.TEXT_PRIMARY)
+
+    def set_value(self, key: str, text: str, fg: str | None = None) -> None:
+        """Update a metric's displayed value.
+
+        Args:
+            key: The metric key from the specs.
+            text: The new value text.
+            fg: Optional new text color.
+        """
+        old_text, old_fg = self._shown[key]
+        if fg is None:
+            fg = old_fg
+        if (text, fg) == (old_text, old_fg):
+            return
+        self._shown[key] = (text, fg)
+        self._values[key].configure(text=text, fg=fg)
+
+    def clear(self, text: str = "--") -> None:
+        """Show the same placeholder text for every metric.
+
+        Args:
+            text: Placeholder text.
+        """
+        for key in self._values:
+            self.set_value(key, text)
@@ -0,0 +1,45 @@
+"""CSV export helpers."""
+
+import csv
+import logging
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rows buffered before each writerows() call
+CHUNK_ROWS = 1024
+
+
+def write_csv(path: Path, header: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Write rows to a CSV file in fixed-size chunks.
+
+    Rows are consumed lazily, so a generator can be streamed straight to
+    disk without building an intermediate list.
+
+    Args:
+        path: Destination file.
+        header: Column names for the first line.
+        rows: Row values to write.
+
+    Returns:
+        Number of data rows written.
+    """
+    count = 0
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+
+        chunk: list[Sequence[Any]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= CHUNK_ROWS:
+                writer.writerows(chunk)
+                count += len(chunk)
+                chunk.clear()
+        writer.writerows(chunk)
+        count += len(chunk)
+
+    logger.info("Exported %d rows to %s", count, path)
+    return count
@@ -1,9 +1,17 @@
 """Dashboard screen with portfolio summary and key metrics."""
 
+import functools
 import logging
+import time
 import tkinter as tk
+from concurrent.futures import Future
+from decimal import Decimal
+from tkinter import ttk
 
 from tlh_agent.services import get_provider
+from tlh_agent.services.portfolio import PortfolioSummary
+from tlh_agent.services.scanner import ScanResult
+from tlh_agent.ui.background import run_in_background
 from tlh_agent.ui.base import BaseScreen
 from tlh_agent.ui.components.card import Card, MetricCard
 from tlh_agent.ui.components.page_header import PageHeader
@@ -11,12 +19,52 @@ from tlh_agent.ui.theme import Colors, Fonts, Spacing
 
 logger = logging.getLogger(__name__)
 
+# Opportunities table columns (id, heading), configured once at setup
+_OPP_COLUMNS = (
+    ("ticker", "Ticker"),
+    ("loss", "Loss"),
+    ("benefit", "Tax Benefit"),
+    ("action", ""),
+)
+# Treeview column id ("#N") of the clickable Harvest action
+_OPP_ACTION_COLUMN = f"#{len(_OPP_COLUMNS)}"
+
+# Pre-bound format templates for the summary card values
+_FMT_MONEY = "${:,.2f}".format
+_FMT_SIGNED = "${:+,.2f}".format
+_FMT_PCT = "{:+.2f}%".format
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_money(value: Decimal) -> str:
+    """Format a dollar amount, e.g. ``$1,234.56``."""
+    return _FMT_MONEY(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_money_signed(value: Decimal) -> str:
+    """Format a dollar amount with an explicit sign, e.g. ``$+1,234.56``."""
+    return _FMT_SIGNED(value)
+
 
 class DashboardScreen(BaseScreen):
     """Main dashboard showing portfolio overview and harvest opportunities."""
 
     def _setup_ui(self) -> None:
         """Set up the dashboard layout."""
+        # Refresh rate limiting (max ~4 redraws per second)
+        self._min_refresh_interval_s = 0.25
+        self._last_refresh_ts = 0.0
+        self._pending_refresh_id: str | None = None
+        self._refresh_dirty = False
+        self._last_summary: tuple | None = None
+        # Content keys of the last rendered tables; None forces a redraw
+        self._last_opps_key: tuple | None = None
+        self._last_alerts_key: tuple | None = None
+
+        # Scan running on a worker thread; results from any other future are stale
+        self._scan_future: Future[ScanResult] | None = None
+
         # Header
         header = PageHeader(
             self, title="Dashboard", subtitle="Portfolio overview and harvest opportunities"
@@ -57,30 +105,106 @@ class DashboardScreen(BaseScreen):
         self.opps_card.pack(fill=tk.X, pady=(0, Spacing.LG))
 
         # Add "View All" link to header (styled as clickable text)
-        view_all_btn = tk.Label(
+        view_all_btn = ttk.Button(
             self.opps_card._header,
             text="View All →",
-            font=Fonts.BODY,
-            fg=Colors.ACCENT,
-            bg=Colors.BG_SECONDARY,
+            style="Link.TButton",
             cursor="hand2",
+            command=self._on_view_all_opportunities,
         )
         view_all_btn.pack(side=tk.RIGHT, padx=Spacing.SM)
-        view_all_btn.bind("<Button-1>", lambda e: self._on_view_all_opportunities())
-        view_all_btn.bind("<Enter>", lambda e: view_all_btn.configure(fg=Colors.ACCENT_HOVER))
-        view_all_btn.bind("<Leave>", lambda e: view_all_btn.configure(fg=Colors.ACCENT))
 
         # Store reference to content frame
         self.opps_content = self.opps_card.content
 
+        # Opportunities table - a single Treeview reused across refreshes
+        self.opps_tree = ttk.Treeview(
+            self.opps_content,
+            columns=tuple(col for col, _ in _OPP_COLUMNS),
+            show="headings",
+            height=3,
+            selectmode="browse",
+        )
+        for col, heading in _OPP_COLUMNS:
+            self.opps_tree.heading(col, text=heading, anchor=tk.W)
+            self.opps_tree.column(col, anchor=tk.W, width=120)
+        self.opps_tree.bind("<Double-1>", self._on_opportunity_double_click)
+        self.opps_tree.bind("<Button-1>", self._on_opportunity_click)
+
+        # Placeholder shown instead of the table when there is nothing to list
+        self._opps_message = tk.Label(
+            self.opps_content,
+            text="",
+            font=Fonts.BODY,
+            fg=Colors.TEXT_MUTED,
+            bg=Colors.BG_SECONDARY,
+        )
+        # Which of the two is currently packed, so refreshes only touch the
+        # geometry manager when the visible widget actually changes
+        self._opps_table_visible: bool | None = None
+
         # Wash Sale Alerts section
         self.alerts_card = Card(self, title="Wash Sale Alerts")
         self.alerts_card.pack(fill=tk.X)
 
         self.alerts_content = self.alerts_card.content
 
+        # Single multi-line label reused for every alerts refresh
+        self._alerts_label = tk.Label(
+            self.alerts_content,
+            text="",
+            font=Fonts.BODY,
+            fg=Colors.TEXT_MUTED,
+            bg=Colors.BG_SECONDARY,
+            justify=tk.LEFT,
+            anchor=tk.W,
+        )
+        self._alerts_label.pack(fill=tk.X)
+
+    def _bind_events(self) -> None:
+        """Bind event handlers."""
+        self.bind("<Map>", self._on_map)
+
+    def _on_map(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        """Run any refresh that was skipped while the dashboard was hidden."""
+        if self._refresh_dirty:
+            self.refresh()
+
     def refresh(self) -> None:
+        """Refresh dashboard data, coalescing calls that arrive too quickly.
+
+        Calls made within the minimum refresh interval of the previous
+        refresh are collapsed into a single trailing refresh.
+        """
+        elapsed = time.monotonic() - self._last_refresh_ts
+        if elapsed < self._min_refresh_interval_s:
+            if self._pending_refresh_id is None:
+                delay_ms = int((self._min_refresh_interval_s - elapsed) * 1000)
+                self._pending_refresh_id = self.after(delay_ms, self._do_refresh)
+            return
+
+        self._do_refresh()
+
+    def destroy(self) -> None:
+        """Clean up when widget is destroyed."""
+        if self._pending_refresh_id:
+            self.after_cancel(self._pending_refresh_id)
+        self._scan_future = None
+        super().destroy()
+
+    def _do_refresh(self) -> None:
         """Refresh dashboard data from Alpaca."""
+        if self._pending_refresh_id is not None:
+            self.after_cancel(self._pending_refresh_id)
+            self._pending_refresh_id = None
+
+        # Don't scan or rebuild widgets while hidden; catch up on <Map>
+        if not self.winfo_ismapped():
+            self._refresh_dirty = True
+            return
+        self._refresh_dirty = False
+        self._last_refresh_ts = time.monotonic()
+
         provider = get_provider()
 
         if not provider.is_live or not provider.portfolio:
@@ -107,152 +231,156 @@ class DashboardScreen(BaseScreen):
             f"positions=${position_value}, cash=${account.cash}"
         )
 
-        # Update summary cards
-        self.cards["equity"].set_value(f"${account.equity:,.2f}")
-        self.cards["positions"].set_value(f"${position_value:,.2f}")
+        # Update summary cards (skipped when nothing changed since last refresh)
+        summary_key = (account.equity, account.cash, position_value, summary)
+        if summary_key != self._last_summary:
+            self._last_summary = summary_key
+            self._update_summary_cards(account.equity, account.cash, position_value, summary)
+
+        # Rebuild opportunities list once the background scan completes
+        if provider.scanner:
+            if self._scan_future is None:
+                self._scan_future = run_in_background(
+                    self, provider.scanner.scan, self._on_scan_done
+                )
+        else:
+            self._build_opportunities_table([])
+
+        # Update alerts list
+        restrictions = provider.wash_sale.get_active_restrictions()
+        self._build_alerts_list(restrictions)
+
+    def _update_summary_cards(
+        self,
+        equity: Decimal,
+        cash: Decimal,
+        position_value: Decimal,
+        summary: PortfolioSummary,
+    ) -> None:
+        """Update the summary metric cards.
+
+        Args:
+            equity: Account equity.
+            cash: Account cash (negative when on margin).
+            position_value: Total market value of positions.
+            summary: Portfolio summary for unrealized G/L.
+        """
+        self.cards["equity"].set_value(_fmt_money(equity))
+        self.cards["positions"].set_value(_fmt_money(position_value))
 
         # Show cash with note if negative (margin)
-        if account.cash < 0:
-            self.cards["cash"].set_value(f"${account.cash:,.2f}", "(margin)")
+        if cash < 0:
+            self.cards["cash"].set_value(_fmt_money(cash), "(margin)")
         else:
-            self.cards["cash"].set_value(f"${account.cash:,.2f}")
+            self.cards["cash"].set_value(_fmt_money(cash))
 
         self.cards["unrealized"].set_value(
-            f"${summary.unrealized_gain_loss:+,.2f}",
-            f"{summary.unrealized_gain_loss_pct:+.2f}%",
+            _fmt_money_signed(summary.unrealized_gain_loss),
+            _FMT_PCT(summary.unrealized_gain_loss_pct),
         )
 
-        # Clear and rebuild opportunities list
-        for widget in self.opps_content.winfo_children():
-            widget.destroy()
+    def _on_scan_done(self, future: Future[ScanResult]) -> None:
+        """Render opportunities from a finished background scan.
 
-        if provider.scanner:
-            scan_result = provider.scanner.scan()
-            opportunities = scan_result.opportunities[:3]
-        else:
-            opportunities = []
-        self._build_opportunities_table(opportunities)
+        Args:
+            future: The finished scan. Ignored if the screen has since dropped
+                it (disconnected or destroyed).
+        """
+        if future is not self._scan_future:
+            return
 
-        # Clear and rebuild alerts list
-        for widget in self.alerts_content.winfo_children():
-            widget.destroy()
+        self._scan_future = None
+        try:
+            scan_result = future.result()
+        except Exception:
+            logger.exception("DASHBOARD: portfolio scan failed")
+            self._build_opportunities_table([])
+            return
 
-        restrictions = provider.wash_sale.get_active_restrictions()
-        self._build_alerts_list(restrictions)
+        self._build_opportunities_table(scan_result.opportunities[:3])
 
     def _show_not_connected(self) -> None:
         """Show UI state when Alpaca is not connected."""
         self._mode_badge.configure(text="", fg=Colors.TEXT_MUTED)
+        self._last_summary = None
+        self._last_opps_key = None
+        self._last_alerts_key = None
+
+        # Drop any scan in flight so its result cannot replace this state
+        self._scan_future = None
 
         self.cards["equity"].set_value("--")
         self.cards["positions"].set_value("--")
         self.cards["cash"].set_value("--")
         self.cards["unrealized"].set_value("--")
 
-        for widget in self.opps_content.winfo_children():
-            widget.destroy()
-        label = tk.Label(
-            self.opps_content,
-            text="Connect to Alpaca to view opportunities",
-            font=Fonts.BODY,
-            fg=Colors.TEXT_MUTED,
-            bg=Colors.BG_SECONDARY,
-        )
-        label.pack(pady=Spacing.MD)
+        self.opps_tree.delete(*self.opps_tree.get_children())
+        self._show_opps_message("Connect to Alpaca to view opportunities")
+
+        self._alerts_label.configure(text="", pady=0)
 
-        for widget in self.alerts_content.winfo_children():
-            widget.destroy()
+    def _show_opps_message(self, text: str) -> None:
+        """Hide the opportunities table and show a placeholder message.
+
+        Args:
+            text: The message to display.
+        """
+        self._opps_message.configure(text=text)
+        if self._opps_table_visible is not False:
+            self.opps_tree.pack_forget()
+            self._opps_message.pack(pady=Spacing.MD)
+            self._opps_table_visible = False
 
     def _build_opportunities_table(self, opportunities: list) -> None:
-        """Build the harvest opportunities table.
+        """Populate the harvest opportunities table.
+
+        Existing rows are updated in place and only reconfigured when their
+        values change, so an unchanged table triggers no redraw.
 
         Args:
             opportunities: List of harvest opportunities to display.
         """
-        if not opportunities:
-            label = tk.Label(
-                self.opps_content,
-                text="No harvest opportunities available",
-                font=Fonts.BODY,
-                fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
-            )
-            label.pack(pady=Spacing.MD)
+        key = tuple(
+            (o.ticker, o.unrealized_loss, o.estimated_tax_benefit) for o in opportunities
+        )
+        if key == self._last_opps_key:
             return
+        self._last_opps_key = key
 
-        # Header row - use grid for proper column alignment
-        header_frame = tk.Frame(self.opps_content, bg=Colors.BG_SECONDARY)
-        header_frame.pack(fill=tk.X, pady=(0, Spacing.SM))
+        tree = self.opps_tree
 
-        headers = ["Ticker", "Loss", "Tax Benefit", "Action"]
-        weights = [1, 1, 1, 1]
+        if not opportunities:
+            tree.delete(*tree.get_children())
+            self._show_opps_message("No harvest opportunities available")
+            return
 
-        for i, hdr in enumerate(headers):
-            lbl = tk.Label(
-                header_frame,
-                text=hdr,
-                font=Fonts.CAPTION,
-                fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
-                anchor=tk.W,
-            )
-            lbl.grid(row=0, column=i, sticky="w", padx=(0, Spacing.MD))
-            header_frame.grid_columnconfigure(i, weight=weights[i])
-
-        # Data rows
-        for opp in opportunities:
-            row_frame = tk.Frame(self.opps_content, bg=Colors.BG_SECONDARY)
-            row_frame.pack(fill=tk.X, pady=2)
-
-            # Ticker
-            tk.Label(
-                row_frame,
-                text=opp.ticker,
-                font=Fonts.BODY_BOLD,
-                fg=Colors.TEXT_PRIMARY,
-                bg=Colors.BG_SECONDARY,
-                anchor=tk.W,
-            ).grid(row=0, column=0, sticky="w", padx=(0, Spacing.MD))
-
-            # Loss
-            tk.Label(
-                row_frame,
-                text=f"${opp.unrealized_loss:,.2f}",
-                font=Fonts.BODY,
-                fg=Colors.DANGER_TEXT,
-                bg=Colors.BG_SECONDARY,
-                anchor=tk.W,
-            ).grid(row=0, column=1, sticky="w", padx=(0, Spacing.MD))
-
-            # Tax Benefit
-            tk.Label(
-                row_frame,
-                text=f"${opp.estimated_tax_benefit:,.2f}",
-                font=Fonts.BODY,
-                fg=Colors.SUCCESS_TEXT,
-                bg=Colors.BG_SECONDARY,
-                anchor=tk.W,
-            ).grid(row=0, column=2, sticky="w", padx=(0, Spacing.MD))
-
-            # Action button
-            btn = tk.Button(
-                row_frame,
-                text="Harvest",
-                font=Fonts.CAPTION,
-                fg=Colors.BG_PRIMARY,
-                bg=Colors.ACCENT,
-                activebackground=Colors.ACCENT_HOVER,
-                activeforeground=Colors.BG_PRIMARY,
-                relief=tk.FLAT,
-                cursor="hand2",
-                padx=Spacing.SM,
-                command=lambda t=opp.ticker: self._on_harvest(t),
+        # Bind per-row lookups to locals outside the loop
+        item = tree.item
+        move = tree.move
+        insert = tree.insert
+        fmt_money = _fmt_money
+        stale = set(tree.get_children())
+        for index, opp in enumerate(opportunities):
+            values = (
+                opp.ticker,
+                fmt_money(opp.unrealized_loss),
+                fmt_money(opp.estimated_tax_benefit),
+                "Harvest",
             )
-            btn.grid(row=0, column=3, sticky="w")
-
-            # Configure row columns to match header
-            for i, w in enumerate(weights):
-                row_frame.grid_columnconfigure(i, weight=w)
+            if opp.ticker in stale:
+                stale.discard(opp.ticker)
+                if tuple(item(opp.ticker, "values")) != values:
+                    item(opp.ticker, values=values)
+                move(opp.ticker, "", index)
+            else:
+                insert("", index, iid=opp.ticker, values=values)
+        if stale:
+            tree.delete(*stale)
+
+        if self._opps_table_visible is not True:
+            self._opps_message.pack_forget()
+            tree.pack(fill=tk.X)
+            self._opps_table_visible = True
 
     def _build_alerts_list(self, restrictions: list) -> None:
         """Build the wash sale alerts list.
@@ -260,40 +388,58 @@ class DashboardScreen(BaseScreen):
         Args:
             restrictions: List of active wash sale restrictions.
         """
+        key = tuple((r.ticker, r.days_remaining, r.restriction_end) for r in restrictions[:5])
+        if key == self._last_alerts_key:
+            return
+        self._last_alerts_key = key
+
         if not restrictions:
-            label = tk.Label(
-                self.alerts_content,
+            self._alerts_label.configure(
                 text="No active wash sale restrictions",
-                font=Fonts.BODY,
                 fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
+                pady=Spacing.MD,
             )
-            label.pack(pady=Spacing.MD)
             return
 
-        for restriction in restrictions[:5]:
-            alert_frame = tk.Frame(self.alerts_content, bg=Colors.BG_SECONDARY)
-            alert_frame.pack(fill=tk.X, pady=2)
-
-            msg = (
-                f"{restriction.ticker}: Restriction expires in "
-                f"{restriction.days_remaining} days ({restriction.restriction_end})"
-            )
-
-            tk.Label(
-                alert_frame,
-                text=msg,
-                font=Fonts.BODY,
-                fg=Colors.WARNING,
-                bg=Colors.BG_SECONDARY,
-                anchor=tk.W,
-            ).pack(fill=tk.X)
+        text = "\n".join(
+            f"{r.ticker}: Restriction expires in {r.days_remaining} days ({r.restriction_end})"
+            for r in restrictions[:5]
+        )
+        self._alerts_label.configure(text=text, fg=Colors.WARNING, pady=0)
 
     def _on_view_all_opportunities(self) -> None:
         """Handle View All button click - navigate to harvest queue."""
         # Navigation will be handled by parent
         pass
 
+    def _on_opportunity_double_click(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        """Dispatch a double-click on the opportunities table to the clicked row.
+
+        Rows are inserted with the ticker as their item id, so a single
+        handler serves every row.
+        """
+        # The Harvest cell already acts on its single click
+        if self.opps_tree.identify_column(event.x) == _OPP_ACTION_COLUMN:
+            return
+        ticker = self.opps_tree.identify_row(event.y)
+        if ticker:
+            self._on_harvest(ticker)
+
+    def _on_opportunity_click(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        """Dispatch a click on a row's Harvest action cell.
+
+        The action is drawn as text in the table's last column instead of a
+        button per row, and hit-tested here.
+        """
+        tree = self.opps_tree
+        if tree.identify_region(event.x, event.y) != "cell":
+            return
+        if tree.identify_column(event.x) != _OPP_ACTION_COLUMN:
+            return
+        ticker = tree.identify_row(event.y)
+        if ticker:
+            self._on_harvest(ticker)
+
     def _on_harvest(self, ticker: str) -> None:
         """Handle harvest button click.
 
@@ -2,16 +2,34 @@
 
 import logging
 import tkinter as tk
-from decimal import Decimal
+from concurrent.futures import Future
+from pathlib import Path
+from tkinter import filedialog, messagebox, ttk
 
+from tlh_agent.data.local_store import LossLedgerYear
 from tlh_agent.services import get_provider
+from tlh_agent.ui.background import run_in_background
 from tlh_agent.ui.base import BaseScreen
 from tlh_agent.ui.components.card import Card
 from tlh_agent.ui.components.page_header import PageHeader
+from tlh_agent.ui.export import write_csv
 from tlh_agent.ui.theme import Colors, Fonts, Spacing
 
 logger = logging.getLogger(__name__)
 
+# Year table columns (id, heading, width)
+_YEAR_COLUMNS = (
+    ("year", "Year", 80),
+    ("st", "Short-Term", 120),
+    ("lt", "Long-Term", 120),
+    ("total", "Total Losses", 120),
+    ("used", "Used", 120),
+    ("cf", "Carryforward", 120),
+)
+
+# Row tags by row parity
+_STRIPE_TAGS = (("even",), ("odd",))
+
 
 class LossLedgerScreen(BaseScreen):
     """Screen tracking harvested losses and carryforward balances."""
@@ -35,7 +53,7 @@ class LossLedgerScreen(BaseScreen):
         self.total_carryforward_label = tk.Label(
             summary_content,
             text="$0.00",
-            font=("Inter", 32, "bold"),
+            font=Fonts.DISPLAY,
             fg=Colors.ACCENT,
             bg=Colors.BG_SECONDARY,
         )
@@ -68,6 +86,54 @@ class LossLedgerScreen(BaseScreen):
         year_card.pack(fill=tk.BOTH, expand=True)
 
         self.year_table_frame = year_card.content
+        self._last_ledger_entries: list[tuple[int, LossLedgerYear]] | None = None
+        self._export_in_progress = False
+
+        # Year table - a single Treeview repopulated on refresh
+        self._year_table = tk.Frame(self.year_table_frame, bg=Colors.BG_SECONDARY)
+        self.year_tree = ttk.Treeview(
+            self._year_table,
+            columns=tuple(col for col, _, _ in _YEAR_COLUMNS),
+            show="headings",
+            height=10,
+            selectmode="none",
+        )
+        for col, heading, width in _YEAR_COLUMNS:
+            self.year_tree.heading(col, text=heading, anchor=tk.W)
+            self.year_tree.column(col, width=width, minwidth=50, anchor=tk.W)
+        self.year_tree.tag_configure("even", background=Colors.BG_SECONDARY)
+        self.year_tree.tag_configure("odd", background=Colors.BG_TERTIARY)
+
+        year_scroll = ttk.Scrollbar(
+            self._year_table, orient=tk.VERTICAL, command=self.year_tree.yview
+        )
+        self.year_tree.configure(yscrollcommand=year_scroll.set)
+        self.year_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        year_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._year_empty_label = tk.Label(
+            self.year_table_frame,
+            text="No loss history available",
+            font=Fonts.BODY,
+            fg=Colors.TEXT_MUTED,
+            bg=Colors.BG_SECONDARY,
+        )
+
+        # Explanation text
+        explanation_text = (
+            "Note: Harvested losses can offset capital gains. Up to $3,000 of excess "
+            "losses can be deducted against ordinary income per year. Unused losses "
+            "carry forward indefinitely."
+        )
+        self._year_explanation = tk.Label(
+            self.year_table_frame,
+            text=explanation_text,
+            font=Fonts.CAPTION,
+            fg=Colors.TEXT_MUTED,
+            bg=Colors.BG_PRIMARY,
+            wraplength=700,
+            justify=tk.LEFT,
+        )
 
     def refresh(self) -> None:
         """Refresh loss ledger data from local store."""
@@ -75,18 +141,25 @@ class LossLedgerScreen(BaseScreen):
 
         # Get ledger from local store
         ledger_dict = provider.store.get_loss_ledger()
-        # Convert dict to list sorted by year descending
-        ledger_entries = sorted(ledger_dict.values(), key=lambda e: e.year, reverse=True)
+        # (year, entry) pairs sorted by year descending; entries don't carry their year
+        ledger_entries = sorted(ledger_dict.items(), reverse=True)
+
+        # Nothing to redraw if the ledger is unchanged since the last refresh
+        if ledger_entries == self._last_ledger_entries:
+            return
+        self._last_ledger_entries = ledger_entries
 
         # Calculate carryforward totals
         # The most recent year's carryforward is the available amount
         if ledger_entries:
-            latest = ledger_entries[0]  # Assuming sorted by year descending
+            _, latest = ledger_entries[0]  # Sorted by year descending
             total_cf = latest.carryforward
 
-            # Calculate ST/LT breakdown (simplified - would need more detailed tracking)
-            st_cf = total_cf * Decimal("0.6")  # Approximate split
-            lt_cf = total_cf * Decimal("0.4")
+            # Calculate ST/LT breakdown (simplified - would need more detailed tracking).
+            # Display-only approximation, so plain float math is enough here.
+            total_cf_f = float(total_cf)
+            st_cf = total_cf_f * 0.6  # Approximate split
+            lt_cf = total_cf_f * 0.4
 
             self.total_carryforward_label.configure(text=f"${total_cf:,.2f}")
             self.st_carryforward_label.configure(text=f"Short-term: ${st_cf:,.2f}")
@@ -95,105 +168,91 @@ class LossLedgerScreen(BaseScreen):
         # Build year table
         self._build_year_table(ledger_entries)
 
-    def _build_year_table(self, entries: list) -> None:
+    def _build_year_table(self, entries: list[tuple[int, LossLedgerYear]]) -> None:
         """Build the year-by-year breakdown table.
 
         Args:
-            entries: List of loss ledger entries.
+            entries: (year, ledger entry) pairs, newest year first.
         """
-        # Clear existing content
-        for widget in self.year_table_frame.winfo_children():
-            widget.destroy()
+        tree = self.year_tree
+        tree.delete(*tree.get_children())
 
         if not entries:
-            tk.Label(
-                self.year_table_frame,
-                text="No loss history available",
-                font=Fonts.BODY,
-                fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
-            ).pack(padx=Spacing.MD, pady=Spacing.MD)
+            self._year_table.pack_forget()
+            self._year_explanation.pack_forget()
+            self._year_empty_label.pack(padx=Spacing.MD, pady=Spacing.MD)
             return
 
-        # Table header
-        header_frame = tk.Frame(self.year_table_frame, bg=Colors.BG_TERTIARY)
-        header_frame.pack(fill=tk.X)
-
-        headers = ["Year", "Short-Term", "Long-Term", "Total Losses", "Used", "Carryforward"]
-        widths = [80, 120, 120, 120, 120, 120]
-
-        for header, width in zip(headers, widths, strict=False):
-            tk.Label(
-                header_frame,
-                text=header,
-                font=Fonts.BODY_BOLD,
-                fg=Colors.TEXT_PRIMARY,
-                bg=Colors.BG_TERTIARY,
-                width=width // 8,
-                anchor=tk.W,
-                padx=Spacing.SM,
-                pady=Spacing.SM,
-            ).pack(side=tk.LEFT)
-
-        # Data rows
-        for i, entry in enumerate(entries):
-            bg_color = Colors.BG_SECONDARY if i % 2 == 0 else Colors.BG_TERTIARY
-            row_frame = tk.Frame(self.year_table_frame, bg=bg_color)
-            row_frame.pack(fill=tk.X)
-
-            total_losses = entry.short_term_losses + entry.long_term_losses
-
-            values = [
-                str(entry.year),
-                f"${entry.short_term_losses:,.2f}",
-                f"${entry.long_term_losses:,.2f}",
-                f"${total_losses:,.2f}",
-                f"${entry.used_against_gains:,.2f}",
-                f"${entry.carryforward:,.2f}",
-            ]
-
-            colors = [
-                Colors.TEXT_PRIMARY,
-                Colors.DANGER_TEXT,
-                Colors.DANGER_TEXT,
-                Colors.DANGER_TEXT,
-                Colors.SUCCESS_TEXT,
-                Colors.ACCENT,
-            ]
-
-            for value, width, color in zip(values, widths, colors, strict=False):
-                tk.Label(
-                    row_frame,
-                    text=value,
-                    font=Fonts.BODY,
-                    fg=color,
-                    bg=bg_color,
-                    width=width // 8,
-                    anchor=tk.W,
-                    padx=Spacing.SM,
-                    pady=Spacing.SM,
-                ).pack(side=tk.LEFT)
+        # Format all rows up front so the insert loop only talks to Tk
+        fmt_money = "${:,.2f}".format
+        rows = [
+            (
+                str(year),
+                fmt_money(entry.short_term_losses),
+                fmt_money(entry.long_term_losses),
+                fmt_money(entry.total_losses),
+                fmt_money(entry.used_against_gains),
+                fmt_money(entry.carryforward),
+            )
+            for year, entry in entries
+        ]
+
+        insert = tree.insert
+        for i, values in enumerate(rows):
+            insert("", tk.END, values=values, tags=_STRIPE_TAGS[i % 2])
+
+        self._year_empty_label.pack_forget()
+        self._year_table.pack(fill=tk.BOTH, expand=True)
+        self._year_explanation.pack(anchor=tk.W, pady=Spacing.MD)
 
-        # Explanation text
-        explanation_frame = tk.Frame(self.year_table_frame, bg=Colors.BG_PRIMARY)
-        explanation_frame.pack(fill=tk.X, pady=Spacing.MD)
+    def _on_export(self) -> None:
+        """Export the year-by-year ledger to CSV on a worker thread."""
+        if self._export_in_progress:
+            return
 
-        explanation_text = (
-            "Note: Harvested losses can offset capital gains. Up to $3,000 of excess "
-            "losses can be deducted against ordinary income per year. Unused losses "
-            "carry forward indefinitely."
+        filename = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export Tax Report",
+            defaultextension=".csv",
+            initialfile="loss_ledger.csv",
+            filetypes=[("CSV files", "*.csv")],
         )
-        tk.Label(
-            explanation_frame,
-            text=explanation_text,
-            font=Fonts.CAPTION,
-            fg=Colors.TEXT_MUTED,
-            bg=Colors.BG_PRIMARY,
-            wraplength=700,
-            justify=tk.LEFT,
-        ).pack(anchor=tk.W)
+        if not filename:
+            return
 
-    def _on_export(self) -> None:
-        """Export tax report."""
-        # Would implement tax report export
-        pass
+        entries = list(self._last_ledger_entries or [])
+        rows = (
+            (
+                year,
+                entry.short_term_losses,
+                entry.long_term_losses,
+                entry.total_losses,
+                entry.used_against_gains,
+                entry.carryforward,
+            )
+            for year, entry in entries
+        )
+        header = [heading for _, heading, _ in _YEAR_COLUMNS]
+
+        self._export_in_progress = True
+        run_in_background(
+            self,
+            lambda: write_csv(Path(filename), header, rows),
+            lambda future: self._on_export_done(filename, future),
+        )
+
+    def _on_export_done(self, filename: str, future: Future[int]) -> None:
+        """Report the result of a background export.
+
+        Args:
+            filename: The file that was written.
+            future: The finished export.
+        """
+        self._export_in_progress = False
+        try:
+            count = future.result()
+        except Exception as e:
+            logger.exception("Loss ledger export failed")
+            messagebox.showerror("Export Failed", f"Could not write {filename}: {e}")
+            return
+        messagebox.showinfo("Export Complete", f"Exported {count} years to {filename}")
@@ -2,18 +2,49 @@
 
 import logging
 import tkinter as tk
+from concurrent.futures import Future
+from decimal import Decimal
+from pathlib import Path
+from tkinter import filedialog, messagebox, ttk
 from typing import Any
 
 from tlh_agent.services import get_provider
 from tlh_agent.services.portfolio import Position
+from tlh_agent.ui.background import run_in_background
 from tlh_agent.ui.base import BaseScreen
 from tlh_agent.ui.components.card import Card
 from tlh_agent.ui.components.data_table import ColumnDef, DataTable
 from tlh_agent.ui.components.page_header import PageHeader
+from tlh_agent.ui.components.summary_bar import SummaryBar
+from tlh_agent.ui.export import write_csv
 from tlh_agent.ui.theme import Colors, Fonts, Spacing
 
 logger = logging.getLogger(__name__)
 
+# CSV export columns
+_EXPORT_HEADER = (
+    "Ticker",
+    "Name",
+    "Shares",
+    "Avg Cost",
+    "Current Price",
+    "Market Value",
+    "Cost Basis",
+    "Unrealized G/L",
+    "Unrealized G/L %",
+    "Wash Sale Until",
+)
+
+# Lot details columns (id, heading, width)
+_LOT_COLUMNS = (
+    ("shares", "Shares", 90),
+    ("avg_cost", "Avg Cost", 100),
+    ("cost_basis", "Cost Basis", 120),
+    ("current_price", "Current Price", 110),
+    ("market_value", "Market Value", 120),
+    ("gain_loss", "Unrealized G/L", 120),
+)
+
 
 class PositionsScreen(BaseScreen):
     """Screen showing all portfolio positions with expandable lot details."""
@@ -29,34 +60,17 @@ class PositionsScreen(BaseScreen):
         summary_card = Card(self, title="Portfolio Summary")
         summary_card.pack(fill=tk.X, pady=(0, Spacing.MD))
 
-        self.summary_frame = summary_card.content
-        self.summary_labels: dict[str, tk.Label] = {}
-        for key, label in [
-            ("total_value", "Total Value"),
-            ("total_cost", "Cost Basis"),
-            ("total_gain", "Unrealized G/L"),
-            ("positions", "Positions"),
-        ]:
-            frame = tk.Frame(self.summary_frame, bg=Colors.BG_SECONDARY)
-            frame.pack(side=tk.LEFT, padx=(0, Spacing.XL))
-
-            tk.Label(
-                frame,
-                text=label,
-                font=Fonts.CAPTION,
-                fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
-            ).pack(anchor=tk.W)
-
-            value_label = tk.Label(
-                frame,
-                text="$0.00",
-                font=Fonts.BODY_BOLD,
-                fg=Colors.TEXT_PRIMARY,
-                bg=Colors.BG_SECONDARY,
-            )
-            value_label.pack(anchor=tk.W)
-            self.summary_labels[key] = value_label
+        self.summary_bar = SummaryBar(
+            summary_card.content,
+            [
+                ("total_value", "Total Value"),
+                ("total_cost", "Cost Basis"),
+                ("total_gain", "Unrealized G/L"),
+                ("positions", "Positions"),
+            ],
+            initial="$0.00",
+        )
+        self.summary_bar.pack(fill=tk.X)
 
         # Positions table in card
         table_card = Card(self, title="Holdings")
@@ -79,7 +93,12 @@ class PositionsScreen(BaseScreen):
             columns=columns,
             on_select=self._on_position_select,
             on_double_click=self._on_position_double_click,
+            row_key="ticker",
         )
+        # Rows last pushed to the table, by ticker in display order
+        self._last_rows: dict[str, dict[str, Any]] = {}
+        self._positions: list[Position] = []
+        self._export_in_progress = False
         self.table.pack(fill=tk.BOTH, expand=True)
 
         # Lot details panel (below table)
@@ -98,6 +117,22 @@ class PositionsScreen(BaseScreen):
         )
         self.details_label.pack(fill=tk.X)
 
+        # Lot table, packed on first selection and repopulated afterwards.
+        # Alpaca doesn't provide lot-level data, so each position shows as
+        # a single aggregate lot.
+        self.lots_tree = ttk.Treeview(
+            self.details_frame,
+            columns=tuple(col for col, _, _ in _LOT_COLUMNS),
+            show="headings",
+            height=3,
+            selectmode="none",
+        )
+        for col, heading, width in _LOT_COLUMNS:
+            self.lots_tree.heading(col, text=heading, anchor=tk.E)
+            self.lots_tree.column(col, width=width, minwidth=50, anchor=tk.E)
+        self.lots_tree.tag_configure("gain", foreground=Colors.SUCCESS_TEXT)
+        self.lots_tree.tag_configure("loss", foreground=Colors.DANGER_TEXT)
+
     def refresh(self) -> None:
         """Refresh positions data from Alpaca."""
         provider = get_provider()
@@ -108,22 +143,16 @@ class PositionsScreen(BaseScreen):
             return
 
         positions = provider.portfolio.get_positions()
+        self._positions = positions
 
-        # Update summary
-        total_value = sum(p.market_value for p in positions)
-        total_cost = sum(p.cost_basis for p in positions)
-        total_gain = total_value - total_cost
-
-        self.summary_labels["total_value"].configure(text=f"${total_value:,.2f}")
-        self.summary_labels["total_cost"].configure(text=f"${total_cost:,.2f}")
-
-        gain_color = Colors.SUCCESS_TEXT if total_gain >= 0 else Colors.DANGER_TEXT
-        self.summary_labels["total_gain"].configure(text=f"${total_gain:+,.2f}", fg=gain_color)
-        self.summary_labels["positions"].configure(text=str(len(positions)))
-
-        # Build table data
+        # Build table data, accumulating summary totals in the same pass
         table_data = []
+        total_value = Decimal("0")
+        total_cost = Decimal("0")
         for pos in positions:
+            total_value += pos.market_value
+            total_cost += pos.cost_basis
+
             status = ""
             tag = ""
             if pos.wash_sale_until:
@@ -150,14 +179,48 @@ class PositionsScreen(BaseScreen):
                 }
             )
 
-        self.table.set_data(table_data)
+        # Update summary
+        total_gain = total_value - total_cost
+
+        summary = self.summary_bar
+        summary.set_value("total_value", f"${total_value:,.2f}")
+        summary.set_value("total_cost", f"${total_cost:,.2f}")
+
+        gain_color = Colors.SUCCESS_TEXT if total_gain >= 0 else Colors.DANGER_TEXT
+        summary.set_value("total_gain", f"${total_gain:+,.2f}", fg=gain_color)
+        summary.set_value("positions", str(len(positions)))
+
+        self._update_table(table_data)
+
+    def _update_table(self, table_data: list[dict[str, Any]]) -> None:
+        """Apply only the rows that changed since the last refresh.
+
+        Rows are updated in place while the set and order of tickers stay
+        the same. Any added, removed, or reordered ticker rebuilds the table
+        so it keeps the provider's order and striping.
+
+        Args:
+            table_data: Full list of row data for the current positions.
+        """
+        new_rows = {row["ticker"]: row for row in table_data}
+        old_rows = self._last_rows
+        self._last_rows = new_rows
+
+        if list(new_rows) != list(old_rows):
+            self.table.set_data(table_data)
+            return
+
+        # Rows include _position, so a changed Position is pushed too and
+        # selection handlers never see stale lot data
+        for ticker, row in new_rows.items():
+            if row != old_rows[ticker]:
+                self.table.update_row(row)
 
     def _show_not_connected(self) -> None:
         """Show UI state when Alpaca is not connected."""
-        self.summary_labels["total_value"].configure(text="--")
-        self.summary_labels["total_cost"].configure(text="--")
-        self.summary_labels["total_gain"].configure(text="--")
-        self.summary_labels["positions"].configure(text="--")
+        self.summary_bar.clear()
+        self._last_rows = {}
+        self._positions = []
         self.table.set_data([])
 
     def _on_position_select(self, row: dict[str, Any]) -> None:
@@ -187,64 +250,82 @@ class PositionsScreen(BaseScreen):
         Args:
             position: The position to show details for.
         """
-        # Clear existing details
-        for widget in self.details_frame.winfo_children():
-            widget.destroy()
-
-        # Header
-        header = tk.Label(
-            self.details_frame,
+        self.details_label.configure(
             text=f"Position Details - {position.ticker}",
             font=Fonts.BODY_BOLD,
             fg=Colors.TEXT_PRIMARY,
-            bg=Colors.BG_SECONDARY,
-            anchor=tk.W,
         )
-        header.pack(fill=tk.X, padx=Spacing.MD, pady=(Spacing.SM, Spacing.XS))
-
-        # Position summary (Alpaca doesn't provide lot-level data)
-        details = [
-            ("Shares", f"{position.shares:,.2f}"),
-            ("Avg Cost", f"${position.avg_cost_per_share:,.2f}"),
-            ("Cost Basis", f"${position.cost_basis:,.2f}"),
-            ("Current Price", f"${position.current_price:,.2f}"),
-            ("Market Value", f"${position.market_value:,.2f}"),
-            ("Unrealized G/L", f"${position.unrealized_gain_loss:+,.2f}"),
-        ]
-
-        for label, value in details:
-            row = tk.Frame(self.details_frame, bg=Colors.BG_SECONDARY)
-            row.pack(fill=tk.X, padx=Spacing.MD, pady=1)
-
-            tk.Label(
-                row,
-                text=label,
-                font=Fonts.CAPTION,
-                fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
-                width=15,
-                anchor=tk.W,
-            ).pack(side=tk.LEFT)
-
-            color = Colors.TEXT_PRIMARY
-            if "+" in value and "$" in value:
-                color = Colors.SUCCESS_TEXT
-            elif "-" in value and "$" in value:
-                color = Colors.DANGER_TEXT
-
-            tk.Label(
-                row,
-                text=value,
-                font=Fonts.BODY,
-                fg=color,
-                bg=Colors.BG_SECONDARY,
-                anchor=tk.W,
-            ).pack(side=tk.LEFT)
-
-        # Bottom padding
-        tk.Frame(self.details_frame, bg=Colors.BG_SECONDARY, height=Spacing.SM).pack()
+        if not self.lots_tree.winfo_manager():
+            self.details_label.pack_configure(padx=Spacing.MD, pady=(Spacing.SM, Spacing.XS))
+            self.lots_tree.pack(fill=tk.X, padx=Spacing.MD, pady=(0, Spacing.SM))
+
+        tree = self.lots_tree
+        tree.delete(*tree.get_children())
+        tree.insert(
+            "",
+            tk.END,
+            values=(
+                f"{position.shares:,.2f}",
+                f"${position.avg_cost_per_share:,.2f}",
+                f"${position.cost_basis:,.2f}",
+                f"${position.current_price:,.2f}",
+                f"${position.market_value:,.2f}",
+                f"${position.unrealized_gain_loss:+,.2f}",
+            ),
+            tags=("gain" if position.unrealized_gain_loss >= 0 else "loss",),
+        )
 
     def _on_export(self) -> None:
-        """Handle export button click."""
-        # Will implement CSV export
-        pass
+        """Export positions to CSV on a worker thread."""
+        if self._export_in_progress:
+            return
+
+        filename = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export Positions",
+            defaultextension=".csv",
+            initialfile="positions.csv",
+            filetypes=[("CSV files", "*.csv")],
+        )
+        if not filename:
+            return
+
+        positions = list(self._positions)
+        rows = (
+            (
+                pos.ticker,
+                pos.name,
+                pos.shares,
+                pos.avg_cost_per_share,
+                pos.current_price,
+                pos.market_value,
+                pos.cost_basis,
+                pos.unrealized_gain_loss,
+                pos.unrealized_gain_loss_pct,
+                pos.wash_sale_until or "",
+            )
+            for pos in positions
+        )
+
+        self._export_in_progress = True
+        run_in_background(
+            self,
+            lambda: write_csv(Path(filename), _EXPORT_HEADER, rows),
+            lambda future: self._on_export_done(filename, future),
+        )
+
+    def _on_export_done(self, filename: str, future: Future[int]) -> None:
+        """Report the result of a background export.
+
+        Args:
+            filename: The file that was written.
+            future: The finished export.
+        """
+        self._export_in_progress = False
+        try:
+            count = future.result()
+        except OSError as e:
+            logger.exception("Positions export failed")
+            messagebox.showerror("Export Failed", f"Could not write {filename}: {e}")
+            return
+        messagebox.showinfo("Export Complete", f"Exported {count} positions to {filename}")
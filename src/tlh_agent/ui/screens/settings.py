@@ -1,21 +1,129 @@
 """Settings screen for configuring the application."""
 
+import contextlib
+import functools
 import tkinter as tk
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
 from decimal import Decimal
 from tkinter import messagebox, ttk
+from typing import Any
 
 from tlh_agent.credentials import (
     delete_claude_api_key,
     get_claude_api_key,
-    has_claude_api_key,
     set_claude_api_key,
 )
 from tlh_agent.services import get_provider
+from tlh_agent.ui.background import run_in_background
 from tlh_agent.ui.base import BaseScreen
 from tlh_agent.ui.components.card import Card
 from tlh_agent.ui.components.page_header import PageHeader
-from tlh_agent.ui.theme import Colors, Fonts, Spacing
-
+from tlh_agent.ui.theme import Colors, Spacing
+
+# Values restored by Reset, keyed by field attribute name
+_DEFAULTS: dict[str, Any] = {
+    "min_loss_usd": "100",
+    "min_loss_pct": "3.0",
+    "min_tax_benefit": "50",
+    "tax_rate": "35",
+    "min_holding_days": "7",
+    "max_harvest_pct": "10.0",
+    "wash_window_days": "30",
+    "paper_trading": True,
+}
+
+# Converts each saved field's value to the type stored in config
+_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "min_loss_usd": Decimal,
+    "min_loss_pct": Decimal,
+    "min_tax_benefit": Decimal,
+    "tax_rate": lambda text: Decimal(text) / 100,
+    "min_holding_days": int,
+    "max_harvest_pct": Decimal,
+    "wash_window_days": int,
+    "paper_trading": bool,
+}
+
+# Dropdown choices
+_CLAUDE_MODELS = (
+    "claude-opus-4-5-20251101",
+    "claude-sonnet-4-20250514",
+    "claude-3-5-sonnet-20241022",
+    "claude-3-haiku-20240307",
+)
+_FREQUENCY_OPTIONS = ("Daily", "Weekly", "Monthly")
+_WEEKDAY_OPTIONS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+_REBUY_STRATEGY_OPTIONS = ("Wait", "Swap", "Hybrid")
+_BROKER_OPTIONS = ("Robinhood (Manual)", "Alpaca (API)")
+_ORDER_TYPE_OPTIONS = ("Market", "Limit")
+
+
+@dataclass(frozen=True)
+class _FieldSpec:
+    """Declarative definition of a settings field."""
+
+    attr: str
+    label: str
+    widget_type: str = "entry"
+    options: Sequence[str] = ()
+    default: str = ""
+    width: int = 20
+    saved: bool = False  # Value lives in _values and is written to config
+
+
+# Sections built from field specs, in tab order (the Claude tab is built by hand)
+_SECTION_SPECS: tuple[tuple[str, tuple[_FieldSpec, ...]], ...] = (
+    (
+        "Scanner",
+        (
+            _FieldSpec("scan_frequency", "Frequency:", "dropdown", _FREQUENCY_OPTIONS, "Daily"),
+            _FieldSpec("scan_day", "Weekly Scan Day:", "dropdown", _WEEKDAY_OPTIONS, "Friday"),
+            _FieldSpec("scan_time", "Scan Time (24h):", default="10:30", width=10),
+        ),
+    ),
+    (
+        "Rebuy Strategy",
+        (
+            _FieldSpec("rebuy_strategy", "Strategy:", "dropdown", _REBUY_STRATEGY_OPTIONS, "Swap"),
+            _FieldSpec("wait_days", "Wait Days:", default="31", width=10),
+            _FieldSpec("swap_back_enabled", "Swap Back Enabled:", "checkbox", default="True"),
+            _FieldSpec("swap_back_days", "Swap Back After Days:", default="32", width=10),
+            _FieldSpec("hybrid_threshold", "Hybrid Threshold ($):", default="5000", width=10),
+        ),
+    ),
+    (
+        "Rules Engine",
+        (
+            _FieldSpec("min_loss_usd", "Min Loss ($):", width=10, saved=True),
+            _FieldSpec("min_loss_pct", "Min Loss (%):", width=10, saved=True),
+            _FieldSpec("min_tax_benefit", "Min Tax Benefit ($):", width=10, saved=True),
+            _FieldSpec("tax_rate", "Assumed Tax Rate (%):", width=10, saved=True),
+            _FieldSpec("prefer_short_term", "Prefer Short-Term:", "checkbox", default="True"),
+            _FieldSpec("min_holding_days", "Min Holding Days:", width=10, saved=True),
+            _FieldSpec("max_harvest_pct", "Max Harvest Per Scan (%):", width=10, saved=True),
+        ),
+    ),
+    (
+        "Wash Sale Tracking",
+        (
+            _FieldSpec("wash_window_days", "Window Days:", width=10, saved=True),
+            _FieldSpec("track_external", "Track External Accounts:", "checkbox", default="True"),
+            _FieldSpec("warn_violations", "Warn on Violations:", "checkbox", default="True"),
+        ),
+    ),
+    (
+        "Brokerage",
+        (
+            _FieldSpec("broker_provider", "Provider:", "dropdown", _BROKER_OPTIONS, "Alpaca (API)"),
+            _FieldSpec("paper_trading", "Paper Trading:", "checkbox", saved=True),
+            _FieldSpec("order_type", "Order Type:", "dropdown", _ORDER_TYPE_OPTIONS, "Limit"),
+            _FieldSpec("limit_buffer", "Limit Price Buffer (%):", default="0.1", width=10),
+            _FieldSpec("require_confirm", "Require Confirmation:", "checkbox", default="False"),
+        ),
+    ),
+)
 
 class SettingsScreen(BaseScreen):
     """Screen for configuring application settings."""
@@ -30,51 +138,129 @@ class SettingsScreen(BaseScreen):
         header.add_action_button("Reset", self._on_reset)
         header.add_action_button("Save", self._on_save, primary=True)
 
-        # Scrollable settings area
-        canvas = tk.Canvas(self, bg=Colors.BG_PRIMARY, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=canvas.yview)
-        self.settings_frame = tk.Frame(canvas, bg=Colors.BG_PRIMARY)
+        # One notebook tab per section
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
 
-        self.settings_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Section fields are built the first time their tab is selected
+        self._section_builders: dict[str, Callable[[tk.Frame], None]] = {}
+        self._section_cards: dict[str, Card] = {}
+        self._tab_titles: dict[str, str] = {}
 
-        canvas.create_window((0, 0), window=self.settings_frame, anchor=tk.NW)
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Current value of every saved field, built or not. Tk variables
+        # exist only for built fields and write through to this dict.
+        self._values: dict[str, Any] = dict(_DEFAULTS)
+        self._vars: dict[str, tk.Variable] = {}
+        # (raw value, parsed value) per field, reparsed only when the raw value changes
+        self._parsed: dict[str, tuple[Any, Any]] = {}
 
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Keychain lookups are slow; cleared whenever this screen changes the key
+        self._claude_key_cache: str | None = None
+        self._claude_key_loaded = False  # Whether _claude_key_cache is current
+        # (api key, client) from the last connection test
+        self._claude_client: tuple[str, Any] | None = None
 
         # Build settings sections
-        self._build_claude_settings()
-        self._build_scanner_settings()
-        self._build_rebuy_settings()
-        self._build_rules_settings()
-        self._build_wash_sale_settings()
-        self._build_brokerage_settings()
+        self._build_section("Claude AI Assistant", self._build_claude_settings)
+        for title, specs in _SECTION_SPECS:
+            self._build_section(title, functools.partial(self._build_fields, specs))
+
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._build_selected_section())
+        self._build_selected_section()
 
-    def _build_section(self, title: str) -> tk.Frame:
-        """Build a settings section with title.
+    def _build_section(self, title: str, builder: Callable[[tk.Frame], None]) -> None:
+        """Add a settings tab holding a titled section card.
 
         Args:
-            title: The section title.
+            title: The section title, also used as the tab label.
+            builder: Builds the section fields into the card's content frame.
+        """
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text=title)
+
+        section_card = Card(tab, title=title)
+        section_card.pack(fill=tk.X, pady=(Spacing.MD, 0))
+
+        self._tab_titles[str(tab)] = title
+        self._section_cards[title] = section_card
+        self._section_builders[title] = builder
+
+    def _build_selected_section(self) -> None:
+        """Build the selected tab's fields if this is its first showing."""
+        title = self._tab_titles[self.notebook.select()]
+        builder = self._section_builders.pop(title, None)
+        if builder is not None:
+            builder(self._section_cards[title].content)
+
+    def _set_values(self, values: dict[str, Any]) -> None:
+        """Set saved field values, updating any fields already built.
+
+        Args:
+            values: Values keyed by field name.
+        """
+        self._values.update(values)
+        for key, value in values.items():
+            var = self._vars.get(key)
+            if var is not None:
+                var.set(value)
+
+    def _parsed_value(self, key: str) -> Any:
+        """Get a saved field's value converted to its config type.
+
+        Args:
+            key: Field name.
 
         Returns:
-            The content frame for the section.
+            The parsed value.
+
+        Raises:
+            ValueError: If an integer field's text is not a valid number.
+            decimal.InvalidOperation: If a decimal field's text is not a
+                valid number.
         """
-        section_card = Card(self.settings_frame, title=title)
-        section_card.pack(fill=tk.X, pady=(0, Spacing.MD))
+        raw = self._values[key]
+        cached = self._parsed.get(key)
+        if cached is None or cached[0] != raw:
+            cached = (raw, _PARSERS[key](raw))
+            self._parsed[key] = cached
+        return cached[1]
 
-        return section_card.content
+    def _preparse(self, key: str) -> None:
+        """Parse a field after editing so Save finds it cached.
+
+        Invalid text is left for Save to report.
+
+        Args:
+            key: Field name.
+        """
+        with contextlib.suppress(ValueError, ArithmeticError):
+            self._parsed_value(key)
+
+    def _build_label(self, parent: tk.Frame, label: str) -> int:
+        """Add a field label in column 0 of the next free grid row.
+
+        Args:
+            parent: Grid-managed section content frame.
+            label: Field label.
+
+        Returns:
+            The grid row used, for placing the field's input in column 1.
+        """
+        row = parent.grid_size()[1]
+        ttk.Label(parent, text=label, style="Card.TLabel", width=25, anchor=tk.W).grid(
+            row=row, column=0, sticky=tk.W, pady=2
+        )
+        return row
 
     def _build_field(
         self,
         parent: tk.Frame,
         label: str,
         widget_type: str = "entry",
-        options: list[str] | None = None,
+        options: Sequence[str] = (),
         default: str = "",
         width: int = 20,
+        key: str | None = None,
     ) -> tk.Variable:
         """Build a settings field.
 
@@ -85,72 +271,63 @@ class SettingsScreen(BaseScreen):
             options: Options for dropdown.
             default: Default value.
             width: Widget width.
+            key: Name of a saved field. Its value is taken from, and kept
+                in sync with, the screen's value dict instead of default.
 
         Returns:
             The variable holding the field value.
         """
-        row = tk.Frame(parent, bg=Colors.BG_SECONDARY)
-        row.pack(fill=tk.X, pady=2)
-
-        tk.Label(
-            row,
-            text=label,
-            font=Fonts.BODY,
-            fg=Colors.TEXT_PRIMARY,
-            bg=Colors.BG_SECONDARY,
-            width=25,
-            anchor=tk.W,
-        ).pack(side=tk.LEFT)
+        row = self._build_label(parent, label)
 
+        widget: tk.Widget
+        var: tk.Variable
         if widget_type == "entry":
             var = tk.StringVar(value=default)
-            ttk.Entry(row, textvariable=var, width=width).pack(side=tk.LEFT)
+            widget = ttk.Entry(parent, textvariable=var, width=width)
         elif widget_type == "dropdown":
             var = tk.StringVar(value=default)
-            dropdown = ttk.Combobox(
-                row, textvariable=var, values=options or [], state="readonly", width=width - 2
+            widget = ttk.Combobox(
+                parent, textvariable=var, values=options, state="readonly", width=width - 2
             )
-            dropdown.pack(side=tk.LEFT)
         elif widget_type == "checkbox":
             var = tk.BooleanVar(value=default == "True")
-            ttk.Checkbutton(row, variable=var).pack(side=tk.LEFT)
+            widget = ttk.Checkbutton(parent, variable=var)
         else:
-            var = tk.StringVar(value=default)
+            raise ValueError(f"Unknown widget type: {widget_type}")
+        widget.grid(row=row, column=1, sticky=tk.W, pady=2)
+
+        if key is not None:
+            var.set(self._values[key])
+            var.trace_add("write", lambda *_: self._values.__setitem__(key, var.get()))
+            self._vars[key] = var
+            if widget_type == "entry":
+                widget.bind("<FocusOut>", lambda e: self._preparse(key))
 
         return var
 
-    def _build_claude_settings(self) -> None:
-        """Build Claude AI settings section."""
-        content = self._build_section("Claude AI Assistant")
+    def _build_claude_settings(self, content: tk.Frame) -> None:
+        """Build Claude AI settings section fields.
 
+        Args:
+            content: The section content frame.
+        """
         # API Key field (password style)
-        row = tk.Frame(content, bg=Colors.BG_SECONDARY)
-        row.pack(fill=tk.X, pady=2)
-
-        tk.Label(
-            row,
-            text="API Key:",
-            font=Fonts.BODY,
-            fg=Colors.TEXT_PRIMARY,
-            bg=Colors.BG_SECONDARY,
-            width=25,
-            anchor=tk.W,
-        ).pack(side=tk.LEFT)
+        row = self._build_label(content, "API Key:")
+        key_frame = ttk.Frame(content, style="Card.TFrame")
+        key_frame.grid(row=row, column=1, sticky=tk.W, pady=2)
 
         self.claude_api_key = tk.StringVar()
-        self.claude_api_entry = ttk.Entry(row, textvariable=self.claude_api_key, width=30, show="•")
+        self.claude_api_entry = ttk.Entry(
+            key_frame, textvariable=self.claude_api_key, width=30, show="•"
+        )
         self.claude_api_entry.pack(side=tk.LEFT)
 
         # Show/Hide toggle
         self._api_key_visible = False
-        self.toggle_btn = tk.Button(
-            row,
+        self.toggle_btn = ttk.Button(
+            key_frame,
             text="Show",
-            font=Fonts.CAPTION,
-            fg=Colors.TEXT_MUTED,
-            bg=Colors.BG_SECONDARY,
-            activebackground=Colors.BG_TERTIARY,
-            relief=tk.FLAT,
+            style="Link.TButton",
             command=self._toggle_api_key_visibility,
         )
         self.toggle_btn.pack(side=tk.LEFT, padx=Spacing.XS)
@@ -160,90 +337,40 @@ class SettingsScreen(BaseScreen):
             content,
             "Model:",
             widget_type="dropdown",
-            options=[
-                "claude-opus-4-5-20251101",
-                "claude-sonnet-4-20250514",
-                "claude-3-5-sonnet-20241022",
-                "claude-3-haiku-20240307",
-            ],
+            options=_CLAUDE_MODELS,
             default="claude-opus-4-5-20251101",
         )
 
         # Status indicator
-        status_row = tk.Frame(content, bg=Colors.BG_SECONDARY)
-        status_row.pack(fill=tk.X, pady=2)
-
-        tk.Label(
-            status_row,
-            text="Status:",
-            font=Fonts.BODY,
-            fg=Colors.TEXT_PRIMARY,
-            bg=Colors.BG_SECONDARY,
-            width=25,
-            anchor=tk.W,
-        ).pack(side=tk.LEFT)
-
-        self.claude_status = tk.Label(
-            status_row,
-            text="Not configured",
-            font=Fonts.BODY,
-            fg=Colors.TEXT_MUTED,
-            bg=Colors.BG_SECONDARY,
-        )
-        self.claude_status.pack(side=tk.LEFT)
-
-        # Buttons row
-        buttons_row = tk.Frame(content, bg=Colors.BG_SECONDARY)
-        buttons_row.pack(fill=tk.X, pady=(Spacing.SM, 0))
+        row = self._build_label(content, "Status:")
+        self.claude_status = ttk.Label(content, text="Not configured", style="CardMuted.TLabel")
+        self.claude_status.grid(row=row, column=1, sticky=tk.W, pady=2)
 
-        # Spacer to align with other fields
-        tk.Label(
-            buttons_row,
-            text="",
-            font=Fonts.BODY,
-            bg=Colors.BG_SECONDARY,
-            width=25,
-        ).pack(side=tk.LEFT)
+        # Buttons row, aligned with the field inputs
+        buttons_row = ttk.Frame(content, style="Card.TFrame")
+        buttons_row.grid(
+            row=content.grid_size()[1], column=1, sticky=tk.W, pady=(Spacing.SM, 0)
+        )
 
-        self.save_api_btn = tk.Button(
+        self.save_api_btn = ttk.Button(
             buttons_row,
             text="Save API Key",
-            font=Fonts.BODY,
-            fg=Colors.BG_PRIMARY,
-            bg=Colors.ACCENT,
-            activebackground=Colors.ACCENT_HOVER,
-            activeforeground=Colors.BG_PRIMARY,
-            relief=tk.FLAT,
-            padx=Spacing.SM,
-            pady=Spacing.XS,
+            style="Accent.TButton",
             command=self._save_claude_api_key,
         )
         self.save_api_btn.pack(side=tk.LEFT, padx=(0, Spacing.XS))
 
-        self.test_btn = tk.Button(
+        self.test_btn = ttk.Button(
             buttons_row,
             text="Test Connection",
-            font=Fonts.BODY,
-            fg=Colors.TEXT_PRIMARY,
-            bg=Colors.BG_TERTIARY,
-            activebackground=Colors.BG_SECONDARY,
-            relief=tk.FLAT,
-            padx=Spacing.SM,
-            pady=Spacing.XS,
             command=self._test_claude_connection,
         )
         self.test_btn.pack(side=tk.LEFT, padx=(0, Spacing.XS))
 
-        self.clear_api_btn = tk.Button(
+        self.clear_api_btn = ttk.Button(
             buttons_row,
             text="Clear",
-            font=Fonts.BODY,
-            fg=Colors.DANGER_TEXT,
-            bg=Colors.BG_TERTIARY,
-            activebackground=Colors.BG_SECONDARY,
-            relief=tk.FLAT,
-            padx=Spacing.SM,
-            pady=Spacing.XS,
+            style="Danger.TButton",
             command=self._clear_claude_api_key,
         )
         self.clear_api_btn.pack(side=tk.LEFT)
@@ -261,17 +388,28 @@ class SettingsScreen(BaseScreen):
             self.claude_api_entry.configure(show="•")
             self.toggle_btn.configure(text="Show")
 
+    def _get_cached_claude_key(self) -> str | None:
+        """Get the Claude API key, reading the keychain only on a cache miss.
+
+        Returns:
+            The stored API key, or None if none is configured.
+        """
+        if not self._claude_key_loaded:
+            self._claude_key_cache = get_claude_api_key()
+            self._claude_key_loaded = True
+        return self._claude_key_cache
+
     def _update_claude_status(self) -> None:
         """Update Claude status indicator."""
-        if has_claude_api_key():
-            self.claude_status.configure(text="Configured ✓", fg=Colors.SUCCESS_TEXT)
+        key = self._get_cached_claude_key()
+        if key is not None:
+            self.claude_status.configure(text="Configured ✓", foreground=Colors.SUCCESS_TEXT)
             # Show masked key
-            key = get_claude_api_key()
             if key:
-                masked = key[:8] + "..." + key[-4:] if len(key) > 12 else "****"
+                masked = f"{key[:8]}...{key[-4:]}" if len(key) > 12 else "****"
                 self.claude_api_key.set(masked)
         else:
-            self.claude_status.configure(text="Not configured", fg=Colors.TEXT_MUTED)
+            self.claude_status.configure(text="Not configured", foreground=Colors.TEXT_MUTED)
             self.claude_api_key.set("")
 
     def _save_claude_api_key(self) -> None:
@@ -290,237 +428,93 @@ class SettingsScreen(BaseScreen):
             return
 
         set_claude_api_key(key)
+        self._claude_key_loaded = False
         self._update_claude_status()
         messagebox.showinfo("Success", "Claude API key saved to keychain.")
 
     def _test_claude_connection(self) -> None:
-        """Test Claude API connection."""
-        key = get_claude_api_key()
+        """Test Claude API connection on a worker thread."""
+        key = self._get_cached_claude_key()
         if not key:
             messagebox.showwarning(
                 "Warning", "No API key configured. Please save an API key first."
             )
             return
 
-        # Try to import and test
-        try:
+        # Reuse the client (and its HTTP session) while the key is unchanged
+        if self._claude_client is None or self._claude_client[0] != key:
             import anthropic
 
-            client = anthropic.Anthropic(api_key=key)
-            # Make a minimal API call
-            client.messages.create(
+            self._claude_client = (key, anthropic.Anthropic(api_key=key))
+        client = self._claude_client[1]
+
+        self.test_btn.configure(state=tk.DISABLED)
+        # Make a minimal API call
+        run_in_background(
+            self,
+            lambda: client.messages.create(
                 model="claude-3-haiku-20240307",
                 max_tokens=10,
                 messages=[{"role": "user", "content": "Say 'OK'"}],
-            )
+            ),
+            self._on_claude_test_done,
+        )
+
+    def _on_claude_test_done(self, future: Future[Any]) -> None:
+        """Report the result of a connection test.
+
+        Args:
+            future: The finished API call.
+        """
+        import anthropic
+
+        self.test_btn.configure(state=tk.NORMAL)
+        error = future.exception()
+        if error is None:
             messagebox.showinfo(
                 "Success", "Connection successful! Claude API is working."
             )
-        except anthropic.AuthenticationError:
+        elif isinstance(error, anthropic.AuthenticationError):
             messagebox.showerror(
                 "Error", "Authentication failed. Please check your API key."
             )
-        except anthropic.RateLimitError:
+        elif isinstance(error, anthropic.RateLimitError):
             messagebox.showwarning("Warning", "Rate limited, but API key is valid.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Connection failed: {e}")
+        else:
+            messagebox.showerror("Error", f"Connection failed: {error}")
 
     def _clear_claude_api_key(self) -> None:
         """Clear Claude API key from keychain."""
-        if not has_claude_api_key():
+        if self._get_cached_claude_key() is None:
             messagebox.showinfo("Info", "No API key to clear.")
             return
 
         if messagebox.askyesno("Confirm", "Are you sure you want to remove the Claude API key?"):
             delete_claude_api_key()
+            self._claude_key_loaded = False
             self._update_claude_status()
             messagebox.showinfo("Success", "Claude API key removed from keychain.")
 
-    def _build_scanner_settings(self) -> None:
-        """Build scanner settings section."""
-        content = self._build_section("Scanner")
-
-        self.scan_frequency = self._build_field(
-            content,
-            "Frequency:",
-            widget_type="dropdown",
-            options=["Daily", "Weekly", "Monthly"],
-            default="Daily",
-        )
-
-        self.scan_day = self._build_field(
-            content,
-            "Weekly Scan Day:",
-            widget_type="dropdown",
-            options=["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            default="Friday",
-        )
-
-        self.scan_time = self._build_field(
-            content,
-            "Scan Time (24h):",
-            default="10:30",
-            width=10,
-        )
-
-    def _build_rebuy_settings(self) -> None:
-        """Build rebuy strategy settings section."""
-        content = self._build_section("Rebuy Strategy")
+    def _build_fields(self, specs: tuple[_FieldSpec, ...], content: tk.Frame) -> None:
+        """Build a section's fields from its spec table.
 
-        self.rebuy_strategy = self._build_field(
-            content,
-            "Strategy:",
-            widget_type="dropdown",
-            options=["Wait", "Swap", "Hybrid"],
-            default="Swap",
-        )
+        Each field's variable is stored on the screen under its spec attr.
 
-        self.wait_days = self._build_field(
-            content,
-            "Wait Days:",
-            default="31",
-            width=10,
-        )
-
-        self.swap_back_enabled = self._build_field(
-            content,
-            "Swap Back Enabled:",
-            widget_type="checkbox",
-            default="True",
-        )
-
-        self.swap_back_days = self._build_field(
-            content,
-            "Swap Back After Days:",
-            default="32",
-            width=10,
-        )
-
-        self.hybrid_threshold = self._build_field(
-            content,
-            "Hybrid Threshold ($):",
-            default="5000",
-            width=10,
-        )
-
-    def _build_rules_settings(self) -> None:
-        """Build rules engine settings section."""
-        content = self._build_section("Rules Engine")
-
-        self.min_loss_usd = self._build_field(
-            content,
-            "Min Loss ($):",
-            default="100",
-            width=10,
-        )
-
-        self.min_loss_pct = self._build_field(
-            content,
-            "Min Loss (%):",
-            default="3.0",
-            width=10,
-        )
-
-        self.min_tax_benefit = self._build_field(
-            content,
-            "Min Tax Benefit ($):",
-            default="50",
-            width=10,
-        )
-
-        self.tax_rate = self._build_field(
-            content,
-            "Assumed Tax Rate (%):",
-            default="35",
-            width=10,
-        )
-
-        self.prefer_short_term = self._build_field(
-            content,
-            "Prefer Short-Term:",
-            widget_type="checkbox",
-            default="True",
-        )
-
-        self.min_holding_days = self._build_field(
-            content,
-            "Min Holding Days:",
-            default="7",
-            width=10,
-        )
-
-        self.max_harvest_pct = self._build_field(
-            content,
-            "Max Harvest Per Scan (%):",
-            default="10.0",
-            width=10,
-        )
-
-    def _build_wash_sale_settings(self) -> None:
-        """Build wash sale settings section."""
-        content = self._build_section("Wash Sale Tracking")
-
-        self.wash_window_days = self._build_field(
-            content,
-            "Window Days:",
-            default="30",
-            width=10,
-        )
-
-        self.track_external = self._build_field(
-            content,
-            "Track External Accounts:",
-            widget_type="checkbox",
-            default="True",
-        )
-
-        self.warn_violations = self._build_field(
-            content,
-            "Warn on Violations:",
-            widget_type="checkbox",
-            default="True",
-        )
-
-    def _build_brokerage_settings(self) -> None:
-        """Build brokerage settings section."""
-        content = self._build_section("Brokerage")
-
-        self.broker_provider = self._build_field(
-            content,
-            "Provider:",
-            widget_type="dropdown",
-            options=["Robinhood (Manual)", "Alpaca (API)"],
-            default="Alpaca (API)",
-        )
-
-        self.paper_trading = self._build_field(
-            content,
-            "Paper Trading:",
-            widget_type="checkbox",
-            default="True",
-        )
-
-        self.order_type = self._build_field(
-            content,
-            "Order Type:",
-            widget_type="dropdown",
-            options=["Market", "Limit"],
-            default="Limit",
-        )
-
-        self.limit_buffer = self._build_field(
-            content,
-            "Limit Price Buffer (%):",
-            default="0.1",
-            width=10,
-        )
-
-        self.require_confirm = self._build_field(
-            content,
-            "Require Confirmation:",
-            widget_type="checkbox",
-            default="False",
-        )
+        Args:
+            specs: Field specs, in display order.
+            content: The section content frame.
+        """
+        for spec in specs:
+            var = self._build_field(
+                content,
+                spec.label,
+                widget_type=spec.widget_type,
+                options=spec.options,
+                default=spec.default,
+                width=spec.width,
+                key=spec.attr if spec.saved else None,
+            )
+            setattr(self, spec.attr, var)
 
     def refresh(self) -> None:
         """Refresh settings data from config."""
@@ -528,37 +522,35 @@ class SettingsScreen(BaseScreen):
         config = provider.config
 
         # Load current values into fields
-        self.min_loss_usd.set(str(config.min_loss_usd))
-        self.min_loss_pct.set(str(config.min_loss_pct))
-        self.min_tax_benefit.set(str(config.min_tax_benefit))
-        self.tax_rate.set(str(int(config.tax_rate * 100)))
-        self.min_holding_days.set(str(config.min_holding_days))
-        self.max_harvest_pct.set(str(config.max_harvest_pct))
-        self.wash_window_days.set(str(config.wash_sale_days))
-        self.paper_trading.set(config.alpaca_paper)
+        self._set_values(
+            {
+                "min_loss_usd": str(config.min_loss_usd),
+                "min_loss_pct": str(config.min_loss_pct),
+                "min_tax_benefit": str(config.min_tax_benefit),
+                "tax_rate": str(int(config.tax_rate * 100)),
+                "min_holding_days": str(config.min_holding_days),
+                "max_harvest_pct": str(config.max_harvest_pct),
+                "wash_window_days": str(config.wash_sale_days),
+                "paper_trading": config.alpaca_paper,
+            }
+        )
 
     def _on_save(self) -> None:
         """Save settings to config."""
         provider = get_provider()
 
+        parsed = self._parsed_value
         provider.update_config(
-            min_loss_usd=Decimal(self.min_loss_usd.get()),
-            min_loss_pct=Decimal(self.min_loss_pct.get()),
-            min_tax_benefit=Decimal(self.min_tax_benefit.get()),
-            tax_rate=Decimal(self.tax_rate.get()) / 100,
-            min_holding_days=int(self.min_holding_days.get()),
-            max_harvest_pct=Decimal(self.max_harvest_pct.get()),
-            wash_sale_days=int(self.wash_window_days.get()),
-            alpaca_paper=self.paper_trading.get(),
+            min_loss_usd=parsed("min_loss_usd"),
+            min_loss_pct=parsed("min_loss_pct"),
+            min_tax_benefit=parsed("min_tax_benefit"),
+            tax_rate=parsed("tax_rate"),
+            min_holding_days=parsed("min_holding_days"),
+            max_harvest_pct=parsed("max_harvest_pct"),
+            wash_sale_days=parsed("wash_window_days"),
+            alpaca_paper=parsed("paper_trading"),
         )
 
     def _on_reset(self) -> None:
         """Reset settings to defaults."""
-        self.min_loss_usd.set("100")
-        self.min_loss_pct.set("3.0")
-        self.min_tax_benefit.set("50")
-        self.tax_rate.set("35")
-        self.min_holding_days.set("7")
-        self.max_harvest_pct.set("10.0")
-        self.wash_window_days.set("30")
-        self.paper_trading.set(True)
+        self._set_values(_DEFAULTS)
@@ -2,11 +2,16 @@
 
 import logging
 import tkinter as tk
+from collections.abc import Iterator
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import compress, islice
+from operator import and_, is_
 from tkinter import ttk
 from typing import Any
 
 from tlh_agent.services import get_provider
-from tlh_agent.services.portfolio import Trade
+from tlh_agent.services.portfolio import Trade, TradeFilters
 from tlh_agent.ui.base import BaseScreen
 from tlh_agent.ui.components.card import Card
 from tlh_agent.ui.components.data_table import ColumnDef, DataTable
@@ -15,6 +20,54 @@ from tlh_agent.ui.theme import Colors, Fonts, Spacing
 
 logger = logging.getLogger(__name__)
 
+# Delay after the last keystroke before the ticker filter runs
+_FILTER_DELAY_MS = 100
+
+# Trailing-window Date Range options, in days
+_DATE_RANGE_DAYS = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 90 Days": 90}
+
+# History window fetched for "All Time"
+_DEFAULT_HISTORY_DAYS = 365
+
+# Trades loaded per idle callback during refresh
+_LOAD_CHUNK = 500
+
+
+def _date_range_query(choice: str, today: date) -> tuple[TradeFilters | None, int]:
+    """Translate a Date Range selection into trade history query arguments.
+
+    Args:
+        choice: The selected Date Range option.
+        today: The current date.
+
+    Returns:
+        Tuple of (filters, days) for get_trade_history.
+    """
+    end = None
+    if choice in _DATE_RANGE_DAYS:
+        start = today - timedelta(days=_DATE_RANGE_DAYS[choice])
+    elif choice == "YTD":
+        start = date(today.year, 1, 1)
+    elif choice == "Last Year":
+        start = date(today.year - 1, 1, 1)
+        end = date(today.year - 1, 12, 31)
+    else:
+        return None, _DEFAULT_HISTORY_DAYS
+
+    return TradeFilters(start_date=start, end_date=end), (today - start).days + 1
+
+
+def _empty_columns() -> dict[str, list[Any]]:
+    """Create an empty set of trade columns."""
+    return {
+        "is_buy": [],
+        "is_sell": [],
+        "ticker": [],
+        "is_harvest": [],
+        "total_value": [],
+        "row": [],
+    }
+
 
 class TradeHistoryScreen(BaseScreen):
     """Screen showing log of all executed trades with filtering."""
@@ -64,7 +117,7 @@ class TradeHistoryScreen(BaseScreen):
             width=15,
         )
         date_dropdown.pack(side=tk.LEFT, padx=(0, Spacing.LG))
-        date_dropdown.bind("<<ComboboxSelected>>", lambda e: self._apply_filters())
+        date_dropdown.bind("<<ComboboxSelected>>", lambda e: self.refresh())
 
         # Type filter
         tk.Label(
@@ -103,7 +156,7 @@ class TradeHistoryScreen(BaseScreen):
             width=10,
         )
         ticker_entry.pack(side=tk.LEFT, padx=(0, Spacing.SM))
-        ticker_entry.bind("<KeyRelease>", lambda e: self._apply_filters())
+        ticker_entry.bind("<KeyRelease>", lambda e: self._schedule_apply_filters())
 
         # Clear filters button
         tk.Button(
@@ -124,10 +177,10 @@ class TradeHistoryScreen(BaseScreen):
         stats_row.pack(fill=tk.X)
 
         self.stats_labels: dict[str, tk.Label] = {}
-        for key, label in [
-            ("total_trades", "Total Trades"),
-            ("total_sold", "Total Sold"),
-            ("total_bought", "Total Bought"),
+        for key, label, color in [
+            ("total_trades", "Total Trades", Colors.TEXT_PRIMARY),
+            ("total_sold", "Total Sold", Colors.DANGER_TEXT),
+            ("total_bought", "Total Bought", Colors.SUCCESS_TEXT),
         ]:
             stat_frame = tk.Frame(stats_row, bg=Colors.BG_SECONDARY)
             stat_frame.pack(side=tk.LEFT, padx=(0, Spacing.XL))
@@ -144,12 +197,15 @@ class TradeHistoryScreen(BaseScreen):
                 stat_frame,
                 text="0",
                 font=Fonts.BODY_BOLD,
-                fg=Colors.TEXT_PRIMARY,
+                fg=color,
                 bg=Colors.BG_SECONDARY,
             )
             value_label.pack(side=tk.LEFT, padx=(Spacing.XS, 0))
             self.stats_labels[key] = value_label
 
+        # Stat texts last written to the labels
+        self._last_stats: dict[str, str] = {}
+
         # Trade history table in a card
         table_card = Card(self, title="Trade Log")
         table_card.pack(fill=tk.BOTH, expand=True)
@@ -171,84 +227,241 @@ class TradeHistoryScreen(BaseScreen):
         )
         self.table.pack(fill=tk.BOTH, expand=True)
 
-        # Store all trades for filtering
-        self._all_trades: list[dict[str, Any]] = []
+        # All trades as parallel columns, so filters and totals only touch
+        # the fields they need. "row" holds the display dict for the table.
+        self._columns: dict[str, list[Any]] = _empty_columns()
+
+        # (sold, bought) totals over all loaded trades
+        self._all_totals = (Decimal("0"), Decimal("0"))
+
+        # Ticker text and match mask from the last filter pass
+        self._last_ticker = ""
+        self._last_ticker_mask: list[bool] | None = None
+
+        # Display strings from the last refresh, keyed by the trade fields
+        # they are formatted from
+        self._fmt_cache: dict[tuple[Any, ...], tuple[str, str, str, str]] = {}
+
+        # Rows currently pushed to the table
+        self._visible_rows: list[dict[str, Any]] = []
+
+        # Chunked trade loading state
+        self._pending_trades: Iterator[Trade] = iter(())
+        self._loading_columns: dict[str, list[Any]] = _empty_columns()
+        self._loading_fmt_cache: dict[tuple[Any, ...], tuple[str, str, str, str]] = {}
+        self._load_after_id: str | None = None
+
+        # Pending debounced filter pass while the user is typing
+        self._filter_after_id: str | None = None
 
     def refresh(self) -> None:
-        """Refresh trade history data from Alpaca."""
+        """Refresh trade history data from Alpaca.
+
+        Trades are loaded in chunks from idle callbacks so long histories
+        don't block the event loop. The first chunk is shown right away.
+        """
         provider = get_provider()
 
         trades = []
         if provider.portfolio:
-            trades = provider.portfolio.get_trade_history()
-
-        # Build table data
-        self._all_trades = []
-        for trade in trades:
-            tag = "gain" if trade.trade_type == "buy" else "loss"
-
-            self._all_trades.append(
+            # The date range is applied by the provider, so out-of-range
+            # trades are never fetched or loaded
+            filters, days = _date_range_query(self.date_range_var.get(), date.today())
+            trades = provider.portfolio.get_trade_history(filters=filters, days=days)
+
+        # Drop any load still in progress from an earlier refresh
+        if self._load_after_id is not None:
+            self.after_cancel(self._load_after_id)
+            self._load_after_id = None
+
+        self._pending_trades = iter(trades)
+        self._loading_columns = _empty_columns()
+        self._loading_fmt_cache = {}
+        self._load_chunk()
+
+    def destroy(self) -> None:
+        """Clean up when widget is destroyed."""
+        if self._load_after_id is not None:
+            self.after_cancel(self._load_after_id)
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        super().destroy()
+
+    def _load_chunk(self) -> None:
+        """Append the next chunk of trades to the loading columns."""
+        self._load_after_id = None
+        columns = self._loading_columns
+        is_buy = columns["is_buy"]
+        is_sell = columns["is_sell"]
+        tickers = columns["ticker"]
+        is_harvest = columns["is_harvest"]
+        total_values = columns["total_value"]
+        rows = columns["row"]
+        fmt_cache = self._fmt_cache
+        new_fmt_cache = self._loading_fmt_cache
+
+        loaded = 0
+        for trade in islice(self._pending_trades, _LOAD_CHUNK):
+            loaded += 1
+
+            # Filled trades rarely change between refreshes, so reuse their
+            # formatted strings
+            fmt_key = (
+                trade.id,
+                trade.executed_at,
+                trade.shares,
+                trade.price_per_share,
+                trade.total_value,
+            )
+            formatted = fmt_cache.get(fmt_key)
+            if formatted is None:
+                formatted = (
+                    trade.executed_at.isoformat(),
+                    f"{trade.shares:,.2f}",
+                    f"${trade.price_per_share:,.2f}",
+                    f"${trade.total_value:,.2f}",
+                )
+            new_fmt_cache[fmt_key] = formatted
+            date_str, shares_str, price_str, total_str = formatted
+
+            is_buy.append(trade.trade_type == "buy")
+            is_sell.append(trade.trade_type == "sell")
+            tickers.append(trade.ticker)
+            is_harvest.append(bool(trade.harvest_event_id))
+            total_values.append(trade.total_value)
+            rows.append(
                 {
-                    "date": trade.executed_at.strftime("%Y-%m-%d"),
+                    "date": date_str,
                     "type": trade.trade_type.upper(),
                     "ticker": trade.ticker,
-                    "shares": f"{trade.shares:,.2f}",
-                    "price": f"${trade.price_per_share:,.2f}",
-                    "total": f"${trade.total_value:,.2f}",
+                    "shares": shares_str,
+                    "price": price_str,
+                    "total": total_str,
                     "harvest_id": trade.harvest_event_id or "-",
-                    "tag": tag,
+                    "tag": "gain" if trade.trade_type == "buy" else "loss",
                     "_trade": trade,
                 }
             )
 
+        if loaded < _LOAD_CHUNK:
+            # All trades loaded
+            self._fmt_cache = new_fmt_cache
+            self._set_columns(columns)
+            return
+
+        if len(rows) == _LOAD_CHUNK:
+            # Show the first chunk while the rest loads. Copy the lists so
+            # later chunks don't grow them under the filter caches.
+            self._set_columns({key: list(values) for key, values in columns.items()})
+        self._load_after_id = self.after_idle(self._load_chunk)
+
+    def _set_columns(self, columns: dict[str, list[Any]]) -> None:
+        """Replace the trade columns and re-apply filters.
+
+        Args:
+            columns: The new trade columns.
+        """
+        self._columns = columns
+        total_values = columns["total_value"]
+        self._all_totals = (
+            sum(compress(total_values, columns["is_sell"]), Decimal("0")),
+            sum(compress(total_values, columns["is_buy"]), Decimal("0")),
+        )
+        self._last_ticker_mask = None
+        self._apply_filters()
+
+    def _schedule_apply_filters(self) -> None:
+        """Apply filters once typing pauses, coalescing bursts of keystrokes."""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(_FILTER_DELAY_MS, self._apply_filters_now)
+
+    def _apply_filters_now(self) -> None:
+        """Run a debounced filter pass."""
+        self._filter_after_id = None
         self._apply_filters()
 
     def _apply_filters(self) -> None:
         """Apply current filters to the data."""
-        filtered = self._all_trades.copy()
+        columns = self._columns
+        is_buy = columns["is_buy"]
+        is_sell = columns["is_sell"]
+        tickers = columns["ticker"]
+        is_harvest = columns["is_harvest"]
+        total_values = columns["total_value"]
+        rows = columns["row"]
+
+        # Row mask built from whole-column passes; None means every row matches
+        mask: list[bool] | None = None
 
         # Type filter
         type_filter = self.type_var.get()
         if type_filter == "Buy":
-            filtered = [t for t in filtered if t["type"] == "BUY"]
+            mask = is_buy
         elif type_filter == "Sell":
-            filtered = [t for t in filtered if t["type"] == "SELL"]
+            mask = is_sell
         elif type_filter == "Harvests Only":
-            filtered = [t for t in filtered if t["harvest_id"] != "-"]
+            mask = is_harvest
 
         # Ticker filter
         ticker_filter = self.ticker_var.get().upper().strip()
         if ticker_filter:
-            filtered = [t for t in filtered if ticker_filter in t["ticker"]]
-
-        # Update table
-        self.table.set_data(filtered)
+            last_mask = self._last_ticker_mask
+            if last_mask is not None and ticker_filter.startswith(self._last_ticker):
+                # Extending the text can only drop matches, so only re-test
+                # the rows that matched last time
+                ticker_mask = [
+                    m and ticker_filter in t for m, t in zip(last_mask, tickers, strict=True)
+                ]
+            else:
+                ticker_mask = [ticker_filter in t for t in tickers]
+            self._last_ticker = ticker_filter
+            self._last_ticker_mask = ticker_mask
+            mask = ticker_mask if mask is None else list(map(and_, mask, ticker_mask))
+        else:
+            self._last_ticker_mask = None
+
+        # With no filter active, show everything with the totals cached at load
+        if mask is None:
+            visible = rows
+            total_sold, total_bought = self._all_totals
+        else:
+            visible = list(compress(rows, mask))
+            total_sold = sum(compress(total_values, map(and_, mask, is_sell)), Decimal("0"))
+            total_bought = sum(compress(total_values, map(and_, mask, is_buy)), Decimal("0"))
+
+        # Row dicts are built once per refresh, so an unchanged match set
+        # means the very same objects and the table can be left alone
+        last_visible = self._visible_rows
+        if visible is not last_visible and (
+            len(visible) != len(last_visible) or not all(map(is_, visible, last_visible))
+        ):
+            self._visible_rows = visible
+            self.table.set_data(visible)
 
         # Update stats
-        total_trades = len(filtered)
-        total_sold = sum(
-            t["_trade"].total_value for t in filtered if t["_trade"].trade_type == "sell"
-        )
-        total_bought = sum(
-            t["_trade"].total_value for t in filtered if t["_trade"].trade_type == "buy"
-        )
-
-        self.stats_labels["total_trades"].configure(text=str(total_trades))
-        self.stats_labels["total_sold"].configure(
-            text=f"${total_sold:,.2f}",
-            fg=Colors.DANGER_TEXT,
-        )
-        self.stats_labels["total_bought"].configure(
-            text=f"${total_bought:,.2f}",
-            fg=Colors.SUCCESS_TEXT,
-        )
+        stats = {
+            "total_trades": str(len(visible)),
+            "total_sold": f"${total_sold:,.2f}",
+            "total_bought": f"${total_bought:,.2f}",
+        }
+        last_stats = self._last_stats
+        for key, text in stats.items():
+            if last_stats.get(key) != text:
+                last_stats[key] = text
+                self.stats_labels[key].configure(text=text)
 
     def _clear_filters(self) -> None:
         """Reset all filters."""
+        date_range_changed = self.date_range_var.get() != "All Time"
         self.date_range_var.set("All Time")
         self.type_var.set("All")
         self.ticker_var.set("")
-        self._apply_filters()
+        self._last_ticker_mask = None
+        if date_range_changed:
+            self.refresh()
+        else:
+            self._apply_filters()
 
     def _on_select(self, row: dict[str, Any]) -> None:
         """Handle row selection."""
@@ -6,25 +6,54 @@ Displays trades from multiple sources:
 - Rebalance trades (drift correction)
 """
 
+import contextlib
+import functools
 import logging
 import tkinter as tk
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
 from decimal import Decimal
 from tkinter import messagebox, ttk
 from typing import Any
 
 from tlh_agent.services import get_provider
-from tlh_agent.services.execution import ExecutionStatus
+from tlh_agent.services.execution import ExecutionResult, ExecutionService, ExecutionStatus
 from tlh_agent.services.scanner import HarvestOpportunity
-from tlh_agent.services.trade_queue import TradeQueueService, TradeStatus
+from tlh_agent.services.trade_queue import QueuedTrade, TradeQueueService, TradeStatus, TradeType
+from tlh_agent.ui.background import run_in_background
 from tlh_agent.ui.base import BaseScreen
 from tlh_agent.ui.components.card import Card
 from tlh_agent.ui.components.data_table import ColumnDef, DataTable
 from tlh_agent.ui.components.page_header import PageHeader
+from tlh_agent.ui.components.summary_bar import SummaryBar
 from tlh_agent.ui.theme import Colors, Fonts, Spacing
 
 logger = logging.getLogger(__name__)
 
+# Queue statuses that count toward totals (None = not yet queued)
+_ACTIVE_STATUSES = frozenset((None, "pending", "approved"))
+
+# Delay after the last keystroke before the filter runs
+_FILTER_DELAY_MS = 200
+
+# How often the progress window polls the execution worker
+_PROGRESS_POLL_MS = 100
+
+# Row tag for each harvest queue status
+_STATUS_TAG = {"approved": "gain", "rejected": "muted", "expired": "muted"}
+
+
+@functools.cache
+def _status_display(status: str) -> str:
+    """Get the title-cased display text for a queue status or action."""
+    return status.title()
+
+
+@functools.cache
+def _type_display(trade_type: TradeType) -> str:
+    """Get the display text for a queued trade type."""
+    return trade_type.value.replace("_", " ").title()
+
 
 class TradeQueueScreen(BaseScreen):
     """Screen for reviewing and acting on pending trades from all sources."""
@@ -45,11 +74,17 @@ class TradeQueueScreen(BaseScreen):
         self._trade_queue = trade_queue
         self._on_navigate_to_dashboard = on_navigate_to_dashboard
         self._all_table_data: list[dict] = []  # Unfiltered data
-        self._last_trade_count = 0  # Track trade count for auto-refresh
-        self._refresh_job: str | None = None
+        self._last_opportunities: list[HarvestOpportunity] = []  # From last scan
+        self._last_refresh_token: tuple | None = None  # Content shown by last refresh
+        self._refresh_job: str | None = None  # Refresh queued by a queue change
+        self._changing_queue = False  # True while this screen edits the queue
+        self._filter_job: str | None = None  # Pending debounced filter pass
         self._progress_window: tk.Toplevel | None = None
+        # (current, symbol, action) published by the execution worker
+        self._execution_progress: tuple[int, str, str] | None = None
         super().__init__(parent)
-        self._schedule_auto_refresh()
+        if trade_queue:
+            trade_queue.add_listener(self._on_queue_changed)
 
     def _setup_ui(self) -> None:
         """Set up the trade queue layout."""
@@ -66,40 +101,23 @@ class TradeQueueScreen(BaseScreen):
             bg=Colors.BG_PRIMARY,
         )
         self.total_savings_label.pack(side=tk.RIGHT)
+        self._savings_text = self.total_savings_label.cget("text")
 
         # Summary card
         summary_card = Card(self, title="Queue Summary")
         summary_card.pack(fill=tk.X, pady=(0, Spacing.MD))
 
-        summary_content = summary_card.content
-        self.summary_labels: dict[str, tk.Label] = {}
-        for key, label in [
-            ("total", "Total Trades"),
-            ("pending", "Pending"),
-            ("approved", "Approved"),
-            ("total_loss", "Total Loss"),
-            ("tax_benefit", "Tax Benefit"),
-        ]:
-            frame = tk.Frame(summary_content, bg=Colors.BG_SECONDARY)
-            frame.pack(side=tk.LEFT, padx=(0, Spacing.XL))
-
-            tk.Label(
-                frame,
-                text=label,
-                font=Fonts.CAPTION,
-                fg=Colors.TEXT_MUTED,
-                bg=Colors.BG_SECONDARY,
-            ).pack(anchor=tk.W)
-
-            value_label = tk.Label(
-                frame,
-                text="0",
-                font=Fonts.BODY_BOLD,
-                fg=Colors.TEXT_PRIMARY,
-                bg=Colors.BG_SECONDARY,
-            )
-            value_label.pack(anchor=tk.W)
-            self.summary_labels[key] = value_label
+        self.summary_bar = SummaryBar(
+            summary_card.content,
+            [
+                ("total", "Total Trades"),
+                ("pending", "Pending"),
+                ("approved", "Approved"),
+                ("total_loss", "Total Loss"),
+                ("tax_benefit", "Tax Benefit"),
+            ],
+        )
+        self.summary_bar.pack(fill=tk.X)
 
         # Filter row
         filter_frame = tk.Frame(self, bg=Colors.BG_PRIMARY)
@@ -114,7 +132,7 @@ class TradeQueueScreen(BaseScreen):
         ).pack(side=tk.LEFT, padx=(0, Spacing.SM))
 
         self._filter_var = tk.StringVar()
-        self._filter_var.trace_add("write", lambda *_: self._apply_filter())
+        self._filter_var.trace_add("write", lambda *_: self._on_filter_changed())
         self._filter_entry = tk.Entry(
             filter_frame,
             textvariable=self._filter_var,
@@ -126,6 +144,7 @@ class TradeQueueScreen(BaseScreen):
             width=20,
         )
         self._filter_entry.pack(side=tk.LEFT, padx=(0, Spacing.SM))
+        self._filter_entry.bind("<Return>", lambda e: self._apply_filter())
 
         tk.Label(
             filter_frame,
@@ -259,139 +278,184 @@ class TradeQueueScreen(BaseScreen):
         )
         self.details_label.pack(fill=tk.X)
 
+        # Detail widgets are built on first selection, then reused
+        self._details_grid: tk.Frame | None = None
+        self._detail_labels: dict[str, tk.Label] = {}
+
     def refresh(self) -> None:
         """Refresh harvest queue data from Alpaca."""
         provider = get_provider()
-        table_data = []
 
         # Get harvest opportunities from scanner
         opportunities = []
         if provider.scanner:
             scan_result = provider.scanner.scan()
             opportunities = scan_result.opportunities
-
-        # Add harvest opportunities to table
-        for opp in opportunities:
-            status = opp.queue_status or "pending"
-            status_display = status.title()
-            tag = ""
-            if status == "approved":
-                tag = "gain"
-            elif status in ("rejected", "expired"):
-                tag = "muted"
-
-            amount = opp.shares * opp.current_price
-
-            table_data.append(
-                {
-                    "trade_type": "Harvest",
-                    "status": status_display,
-                    "ticker": opp.ticker,
-                    "name": opp.ticker,
-                    "action": "Sell",
-                    "shares": f"{opp.shares:,.2f}",
-                    "amount": f"${amount:,.2f}",
-                    "tax_benefit": f"${opp.estimated_tax_benefit:,.2f}",
-                    "tag": tag,
-                    "_opportunity": opp,
-                }
-            )
+        self._last_opportunities = opportunities
 
         # Get trades from trade queue service (added by assistant)
-        if self._trade_queue:
-            queued_trades = self._trade_queue.get_pending_trades()
-            for trade in queued_trades:
-                type_display = trade.trade_type.value.replace("_", " ").title()
-                status_display = trade.status.value.title()
-                tag = ""
-                if trade.status.value == "approved":
-                    tag = "gain"
-
-                table_data.append(
-                    {
-                        "trade_type": type_display,
-                        "status": status_display,
-                        "ticker": trade.symbol,
-                        "name": trade.name,
-                        "action": trade.action.value.title(),
-                        "shares": f"{trade.shares:,.2f}",
-                        "amount": f"${trade.notional:,.2f}",
-                        "tax_benefit": "-",
-                        "tag": tag,
-                        "_queued_trade": trade,
-                    }
+        queued_trades = self._trade_queue.get_pending_trades() if self._trade_queue else []
+
+        # Skip the rebuild when nothing shown on screen has changed
+        token = (
+            tuple(
+                (
+                    o.ticker,
+                    o.queue_id,
+                    o.queue_status,
+                    o.shares,
+                    o.current_price,
+                    o.unrealized_loss,
+                    o.estimated_tax_benefit,
                 )
-
-        # Update summary counts
-        total_count = len(table_data)
-        pending_count = sum(1 for o in opportunities if (o.queue_status or "pending") == "pending")
-        approved_count = sum(1 for o in opportunities if o.queue_status == "approved")
-        if self._trade_queue:
-            pending_count += len(self._trade_queue.get_pending_trades())
-        active_statuses = ("pending", "approved", None)
-        total_loss = sum(o.unrealized_loss for o in opportunities if o.queue_status in active_statuses)
-        total_benefit = sum(
-            o.estimated_tax_benefit for o in opportunities if o.queue_status in active_statuses
+                for o in opportunities
+            ),
+            tuple((t.id, t.status) for t in queued_trades),
         )
+        if token == self._last_refresh_token:
+            return
+        self._last_refresh_token = token
 
-        self.summary_labels["total"].configure(text=str(total_count))
-        self.summary_labels["pending"].configure(text=str(pending_count))
-        self.summary_labels["approved"].configure(text=str(approved_count))
-        self.summary_labels["total_loss"].configure(
-            text=f"${total_loss:,.2f}",
-            fg=Colors.DANGER_TEXT,
-        )
-        self.summary_labels["tax_benefit"].configure(
-            text=f"${total_benefit:,.2f}",
-            fg=Colors.SUCCESS_TEXT,
+        # Format templates bound once for all rows
+        fmt_money = "${:,.2f}".format
+        fmt_number = "{:,.2f}".format
+
+        # Add harvest opportunities to table
+        table_data = [
+            {
+                "trade_type": "Harvest",
+                "status": _status_display(opp.queue_status or "pending"),
+                "ticker": opp.ticker,
+                "name": opp.ticker,
+                "action": "Sell",
+                "shares": fmt_number(opp.shares),
+                "amount": fmt_money(opp.shares * opp.current_price),
+                "tax_benefit": fmt_money(opp.estimated_tax_benefit),
+                "tag": _STATUS_TAG.get(opp.queue_status or "pending", ""),
+                "_search": opp.ticker.lower(),
+                "_opportunity": opp,
+            }
+            for opp in opportunities
+        ]
+
+        # Add queued trades to table
+        table_data.extend(
+            {
+                "trade_type": _type_display(trade.trade_type),
+                "status": _status_display(trade.status.value),
+                "ticker": trade.symbol,
+                "name": trade.name,
+                "action": _status_display(trade.action.value),
+                "shares": fmt_number(trade.shares),
+                "amount": fmt_money(trade.notional),
+                "tax_benefit": "-",
+                "tag": "gain" if trade.status is TradeStatus.APPROVED else "",
+                "_search": f"{trade.symbol}\n{trade.name}".lower(),
+                "_queued_trade": trade,
+            }
+            for trade in queued_trades
         )
 
+        # Update summary counts in a single pass over the opportunities
+        total_count = len(table_data)
+        pending_count = len(queued_trades)
+        approved_count = 0
+        total_loss = Decimal("0")
+        total_benefit = Decimal("0")
+        for opp in opportunities:
+            status = opp.queue_status
+            if status not in _ACTIVE_STATUSES:
+                continue
+            if status == "approved":
+                approved_count += 1
+            else:
+                pending_count += 1
+            total_loss += opp.unrealized_loss
+            total_benefit += opp.estimated_tax_benefit
+
+        summary = self.summary_bar
+        summary.set_value("total", str(total_count))
+        summary.set_value("pending", str(pending_count))
+        summary.set_value("approved", str(approved_count))
+        summary.set_value("total_loss", f"${total_loss:,.2f}", fg=Colors.DANGER_TEXT)
+        summary.set_value("tax_benefit", f"${total_benefit:,.2f}", fg=Colors.SUCCESS_TEXT)
+
         # Update total savings
-        self.total_savings_label.configure(text=f"Potential Savings: ${total_benefit:,.2f}")
+        savings_text = f"Potential Savings: ${total_benefit:,.2f}"
+        if savings_text != self._savings_text:
+            self._savings_text = savings_text
+            self.total_savings_label.configure(text=savings_text)
 
-        # Store unfiltered data and apply any active filter
+        # Load all rows once; filtering then only toggles their visibility
         self._all_table_data = table_data
+        self.table.set_data(table_data)
         self._apply_filter()
 
+    def _on_filter_changed(self) -> None:
+        """Apply the filter once typing pauses, coalescing bursts of keystrokes."""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(_FILTER_DELAY_MS, self._apply_filter)
+
     def _apply_filter(self) -> None:
         """Apply the current filter to table data."""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+
         filter_text = self._filter_var.get().strip().lower()
 
         if not filter_text:
             # No filter, show all data
-            self.table.set_data(self._all_table_data)
+            self.table.set_visible_rows(self._all_table_data)
             return
 
-        # Filter by ticker or name
-        filtered = [
-            row for row in self._all_table_data
-            if filter_text in row.get("ticker", "").lower()
-            or filter_text in row.get("name", "").lower()
-        ]
-        self.table.set_data(filtered)
+        # Filter by ticker or name, using the lowercased search key built in
+        # refresh (fields are newline-separated so a match can't span both)
+        filtered = [row for row in self._all_table_data if filter_text in row["_search"]]
+        self.table.set_visible_rows(filtered)
+
+    @contextlib.contextmanager
+    def _own_queue_change(self) -> Iterator[None]:
+        """Mark queue edits made by this screen, which refreshes itself after."""
+        self._changing_queue = True
+        try:
+            yield
+        finally:
+            self._changing_queue = False
+
+    def _on_queue_changed(self) -> None:
+        """Hand a trade queue change to the Tk thread.
+
+        Called on whichever thread changed the queue (the assistant adds
+        trades from its worker thread), so this only schedules a callback
+        and leaves all state to the Tk thread. Changes made inside
+        _own_queue_change are skipped; the screen refreshes after those
+        itself, and that refresh also picks up anything changed meanwhile.
+        """
+        if not self._changing_queue:
+            self.after(0, self._schedule_queue_refresh)
 
-    def _schedule_auto_refresh(self) -> None:
-        """Schedule periodic check for new trades."""
-        self._check_for_updates()
-        # Check every 2 seconds
-        self._refresh_job = self.after(2000, self._schedule_auto_refresh)
+    def _schedule_queue_refresh(self) -> None:
+        """Queue one refresh for a burst of queue changes (Tk thread only)."""
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._refresh_after_queue_change)
+
+    def _refresh_after_queue_change(self) -> None:
+        """Run the refresh scheduled by _on_queue_changed."""
+        self._refresh_job = None
+        self.refresh()
 
     def destroy(self) -> None:
         """Clean up when widget is destroyed."""
+        if self._trade_queue:
+            self._trade_queue.remove_listener(self._on_queue_changed)
         if self._refresh_job:
             self.after_cancel(self._refresh_job)
+        if self._filter_job:
+            self.after_cancel(self._filter_job)
         super().destroy()
 
-    def _check_for_updates(self) -> None:
-        """Check if trade count changed and refresh if needed."""
-        if not self._trade_queue:
-            return
-
-        current_count = len(self._trade_queue.get_all_trades())
-        if current_count != self._last_trade_count:
-            self._last_trade_count = current_count
-            self.refresh()
-
     def _on_select(self, row: dict[str, Any]) -> None:
         """Handle row selection."""
         opp = row.get("_opportunity")
@@ -400,57 +464,55 @@ class TradeQueueScreen(BaseScreen):
 
         self._show_details(opp)
 
-    def _show_details(self, opp: HarvestOpportunity) -> None:
-        """Show details for a harvest opportunity."""
-        for widget in self.details_frame.winfo_children():
-            widget.destroy()
+    def _build_details_grid(self) -> tk.Frame:
+        """Build the detail labels, reconfigured on each selection.
 
-        # Details grid
-        details = tk.Frame(self.details_frame, bg=Colors.BG_SECONDARY)
-        details.pack(fill=tk.X, padx=Spacing.MD, pady=Spacing.SM)
+        Returns:
+            The frame holding the detail rows.
+        """
+        self._details_grid = details_grid = tk.Frame(self.details_frame, bg=Colors.BG_SECONDARY)
 
         # Row 1: Ticker info
-        row1 = tk.Frame(details, bg=Colors.BG_SECONDARY)
+        row1 = tk.Frame(details_grid, bg=Colors.BG_SECONDARY)
         row1.pack(fill=tk.X, pady=2)
 
-        tk.Label(
+        self._detail_labels["ticker"] = tk.Label(
             row1,
-            text=opp.ticker,
             font=Fonts.BODY_BOLD,
             fg=Colors.TEXT_PRIMARY,
             bg=Colors.BG_SECONDARY,
-        ).pack(side=tk.LEFT)
+        )
+        self._detail_labels["ticker"].pack(side=tk.LEFT)
 
-        status = opp.queue_status or "pending"
-        tk.Label(
+        self._detail_labels["status"] = tk.Label(
             row1,
-            text=f"Status: {status.title()}",
             font=Fonts.BODY,
-            fg=Colors.ACCENT if status == "approved" else Colors.TEXT_MUTED,
             bg=Colors.BG_SECONDARY,
-        ).pack(side=tk.RIGHT)
+        )
+        self._detail_labels["status"].pack(side=tk.RIGHT)
 
         # Row 2: Financial details
-        row2 = tk.Frame(details, bg=Colors.BG_SECONDARY)
+        row2 = tk.Frame(details_grid, bg=Colors.BG_SECONDARY)
         row2.pack(fill=tk.X, pady=2)
 
-        for label, value, color in [
-            ("Shares:", f"{opp.shares:,.2f}", Colors.TEXT_PRIMARY),
-            ("Current Price:", f"${opp.current_price:,.2f}", Colors.TEXT_PRIMARY),
-            ("Cost Basis:", f"${opp.cost_basis:,.2f}", Colors.TEXT_PRIMARY),
-            ("Unrealized Loss:", f"${opp.unrealized_loss:,.2f}", Colors.DANGER_TEXT),
-            ("Est. Tax Benefit:", f"${opp.estimated_tax_benefit:,.2f}", Colors.SUCCESS_TEXT),
+        for key, color in [
+            ("shares", Colors.TEXT_PRIMARY),
+            ("current_price", Colors.TEXT_PRIMARY),
+            ("cost_basis", Colors.TEXT_PRIMARY),
+            ("unrealized_loss", Colors.DANGER_TEXT),
+            ("tax_benefit", Colors.SUCCESS_TEXT),
         ]:
-            tk.Label(
+            label = tk.Label(
                 row2,
-                text=f"{label} {value}",
                 font=Fonts.BODY,
                 fg=color,
                 bg=Colors.BG_SECONDARY,
-            ).pack(side=tk.LEFT, padx=(0, Spacing.LG))
+            )
+            label.pack(side=tk.LEFT, padx=(0, Spacing.LG))
+            self._detail_labels[key] = label
 
         # Row 3: Action recommendation
-        row3 = tk.Frame(details, bg=Colors.BG_SECONDARY)
+        row3 = tk.Frame(details_grid, bg=Colors.BG_SECONDARY)
         row3.pack(fill=tk.X, pady=2)
 
         tk.Label(
@@ -461,6 +523,29 @@ class TradeQueueScreen(BaseScreen):
             bg=Colors.BG_SECONDARY,
         ).pack(side=tk.LEFT)
 
+        return details_grid
+
+    def _show_details(self, opp: HarvestOpportunity) -> None:
+        """Show details for a harvest opportunity."""
+        if self._details_grid is None:
+            self.details_label.pack_forget()
+            self._build_details_grid().pack(fill=tk.X, padx=Spacing.MD, pady=Spacing.SM)
+
+        labels = self._detail_labels
+        labels["ticker"].configure(text=opp.ticker)
+
+        status = opp.queue_status or "pending"
+        labels["status"].configure(
+            text=f"Status: {status.title()}",
+            fg=Colors.ACCENT if status == "approved" else Colors.TEXT_MUTED,
+        )
+
+        labels["shares"].configure(text=f"Shares: {opp.shares:,.2f}")
+        labels["current_price"].configure(text=f"Current Price: ${opp.current_price:,.2f}")
+        labels["cost_basis"].configure(text=f"Cost Basis: ${opp.cost_basis:,.2f}")
+        labels["unrealized_loss"].configure(text=f"Unrealized Loss: ${opp.unrealized_loss:,.2f}")
+        labels["tax_benefit"].configure(text=f"Est. Tax Benefit: ${opp.estimated_tax_benefit:,.2f}")
+
     def _on_approve(self) -> None:
         """Approve selected trade (harvest opportunity or queued trade)."""
         selected = self.table.get_selected()
@@ -479,7 +564,8 @@ class TradeQueueScreen(BaseScreen):
         # Handle queued trades
         queued = selected.get("_queued_trade")
         if queued and self._trade_queue:
-            self._trade_queue.approve_trade(queued.id)
+            with self._own_queue_change():
+                self._trade_queue.approve_trade(queued.id)
             self.refresh()
 
     def _on_reject(self) -> None:
@@ -500,23 +586,34 @@ class TradeQueueScreen(BaseScreen):
         # Handle queued trades - remove from queue
         queued = selected.get("_queued_trade")
         if queued and self._trade_queue:
-            self._trade_queue.remove_trade(queued.id)
+            with self._own_queue_change():
+                self._trade_queue.remove_trade(queued.id)
             self.refresh()
 
+    def _pending_queue_ids(self) -> list[str]:
+        """Get queue IDs of pending harvests from the last scan.
+
+        Returns:
+            Queue item IDs for opportunities that are queued and pending.
+        """
+        return [
+            opp.queue_id
+            for opp in self._last_opportunities
+            if opp.queue_id and opp.queue_status == "pending"
+        ]
+
     def _on_approve_all(self) -> None:
         """Approve all pending trades."""
         provider = get_provider()
 
-        # Approve harvest opportunities
+        # Approve harvest opportunities from the last scan in one batch
         if provider.scanner:
-            scan_result = provider.scanner.scan()
-            for opp in scan_result.opportunities:
-                if (opp.queue_status or "pending") == "pending":
-                    provider.scanner.approve_harvest(opp.id)
+            provider.scanner.approve_harvests(self._pending_queue_ids())
 
         # Approve queued trades
         if self._trade_queue:
-            self._trade_queue.approve_all()
+            with self._own_queue_change():
+                self._trade_queue.approve_all()
 
         self.refresh()
 
@@ -524,16 +621,14 @@ class TradeQueueScreen(BaseScreen):
         """Reject/clear all pending trades."""
         provider = get_provider()
 
-        # Reject harvest opportunities
+        # Reject harvest opportunities from the last scan in one batch
         if provider.scanner:
-            scan_result = provider.scanner.scan()
-            for opp in scan_result.opportunities:
-                if (opp.queue_status or "pending") == "pending":
-                    provider.scanner.reject_harvest(opp.id)
+            provider.scanner.reject_harvests(self._pending_queue_ids())
 
         # Clear all queued trades
         if self._trade_queue:
-            self._trade_queue.clear_queue()
+            with self._own_queue_change():
+                self._trade_queue.clear_queue()
 
         self.refresh()
 
@@ -548,10 +643,7 @@ class TradeQueueScreen(BaseScreen):
             return
 
         # Collect all approved trades
-        approved_harvests = []
-        if provider.scanner:
-            scan_result = provider.scanner.scan()
-            approved_harvests = [o for o in scan_result.opportunities if o.queue_status == "approved"]
+        approved_harvests = [o for o in self._last_opportunities if o.queue_status == "approved"]
 
         approved_queued = []
         if self._trade_queue:
@@ -563,58 +655,115 @@ class TradeQueueScreen(BaseScreen):
             messagebox.showinfo("No Trades", "No approved trades to execute. Approve trades first.")
             return
 
-        # Show progress window
+        # Show progress window; trades run on a worker thread so the UI
+        # stays responsive during each order round-trip
         self._show_progress_window(total_trades)
+        self._execution_progress = None
+        self._poll_execution_progress(total_trades)
+
+        execution = provider.execution
+        run_in_background(
+            self,
+            lambda: self._execute_trades(execution, approved_harvests, approved_queued),
+            self._on_execute_done,
+        )
 
-        # Track results
-        results = {
-            "success": 0,
-            "failed": 0,
-            "pending": 0,
-            "total_value": Decimal("0"),
-            "errors": [],
-        }
+    def _execute_trades(
+        self,
+        execution: ExecutionService,
+        harvests: list[HarvestOpportunity],
+        queued: list[QueuedTrade],
+    ) -> list[tuple[str, QueuedTrade | None, ExecutionResult]]:
+        """Execute approved trades in order. Runs on a worker thread.
+
+        Never touches Tk; progress is published through
+        ``_execution_progress`` for the Tk thread to poll.
 
+        Args:
+            execution: Service placing the orders.
+            harvests: Approved harvest opportunities, executed first.
+            queued: Approved queued trades.
+
+        Returns:
+            (symbol, queued trade or None, result) for each trade.
+        """
+        outcomes: list[tuple[str, QueuedTrade | None, ExecutionResult]] = []
         current = 0
 
         # Execute harvest opportunities
-        for opp in approved_harvests:
+        for opp in harvests:
             current += 1
-            self._update_progress(current, total_trades, opp.ticker, "Selling")
-
-            result = provider.execution.execute_harvest(opp)
-
-            if result.status == ExecutionStatus.SUCCESS:
-                results["success"] += 1
-                results["total_value"] += result.total_value
-            elif result.status == ExecutionStatus.PENDING:
-                results["pending"] += 1
-            else:
-                results["failed"] += 1
-                results["errors"].append(f"{opp.ticker}: {result.error_message}")
+            self._execution_progress = (current, opp.ticker, "Selling")
+            outcomes.append((opp.ticker, None, execution.execute_harvest(opp)))
 
         # Execute queued trades
-        for trade in approved_queued:
+        for trade in queued:
             current += 1
             action = "Buying" if trade.action.value == "buy" else "Selling"
-            self._update_progress(current, total_trades, trade.symbol, action)
+            self._execution_progress = (current, trade.symbol, action)
+            outcomes.append((trade.symbol, trade, execution.execute_queued_trade(trade)))
 
-            result = provider.execution.execute_queued_trade(trade)
+        return outcomes
 
-            if result.status == ExecutionStatus.SUCCESS:
-                self._trade_queue.mark_executed(trade.id, result.price)
-                results["success"] += 1
-                results["total_value"] += result.total_value
-            elif result.status == ExecutionStatus.PENDING:
-                results["pending"] += 1
-            else:
-                self._trade_queue.mark_failed(trade.id, result.error_message or "Unknown error")
-                results["failed"] += 1
-                results["errors"].append(f"{trade.symbol}: {result.error_message}")
+    def _poll_execution_progress(self, total: int) -> None:
+        """Show the worker's latest progress while the progress window is open.
 
+        Args:
+            total: Total number of trades being executed.
+        """
+        if not self._progress_window:
+            return
+
+        progress = self._execution_progress
+        if progress is not None:
+            current, symbol, action = progress
+            self._update_progress(current, total, symbol, action)
+        self.after(_PROGRESS_POLL_MS, self._poll_execution_progress, total)
+
+    def _on_execute_done(
+        self, future: Future[list[tuple[str, QueuedTrade | None, ExecutionResult]]]
+    ) -> None:
+        """Record execution results and report them.
+
+        Args:
+            future: The finished execution run.
+        """
         # Close progress window
         self._close_progress_window()
 
+        try:
+            outcomes = future.result()
+        except Exception as e:
+            logger.exception("Trade execution failed")
+            messagebox.showerror("Execution Failed", f"Trade execution stopped: {e}")
+            self.refresh()
+            return
+
+        # Track results
+        results = {
+            "success": 0,
+            "failed": 0,
+            "pending": 0,
+            "total_value": Decimal("0"),
+            "errors": [],
+        }
+
+        with self._own_queue_change():
+            for symbol, trade, result in outcomes:
+                if result.status == ExecutionStatus.SUCCESS:
+                    if trade and self._trade_queue:
+                        self._trade_queue.mark_executed(trade.id, result.price)
+                    results["success"] += 1
+                    results["total_value"] += result.total_value
+                elif result.status == ExecutionStatus.PENDING:
+                    results["pending"] += 1
+                else:
+                    if trade and self._trade_queue:
+                        error = result.error_message or "Unknown error"
+                        self._trade_queue.mark_failed(trade.id, error)
+                    results["failed"] += 1
+                    results["errors"].append(f"{symbol}: {result.error_message}")
+
         # Show summary
         self._show_execution_summary(results)
 
@@ -693,7 +842,6 @@ class TradeQueueScreen(BaseScreen):
         self._progress_label.configure(text=f"{current} / {total}")
         self._progress_bar["value"] = current
         self._progress_current.configure(text=f"{action} {symbol}...")
-        self._progress_window.update()
 
     def _close_progress_window(self) -> None:
         """Close progress window."""
@@ -83,6 +83,36 @@ class Fonts:
     _family: ClassVar[str | None] = None
     _family_mono: ClassVar[str | None] = None
 
+    # Shared Font objects, created once per Tk root so Tk measures each once
+    _fonts: ClassVar[dict[str, tkfont.Font]] = {}
+
+    @classmethod
+    def _font(
+        cls, key: str, family: str, size: int, weight: str = "normal"
+    ) -> "tkfont.Font | tuple[str, int, str]":
+        """Get a shared Font object for the current Tk root.
+
+        Falls back to a plain font tuple if no root window exists yet.
+
+        Args:
+            key: Cache key for this font role.
+            family: Font family name.
+            size: Point size.
+            weight: "normal" or "bold".
+
+        Returns:
+            The shared Font, or a font tuple without a root window.
+        """
+        root = tk._default_root
+        if root is None:
+            return (family, size, weight)
+
+        font = cls._fonts.get(key)
+        if font is None or font._tk is not root.tk:  # type: ignore[attr-defined]
+            font = tkfont.Font(root=root, family=family, size=size, weight=weight)
+            cls._fonts[key] = font
+        return font
+
     @classmethod
     def _ensure_initialized(cls) -> None:
         """Initialize font families if not already done."""
@@ -107,52 +137,59 @@ class Fonts:
 
     @classmethod
     @property
-    def HEADING(cls) -> tuple[str, int, str]:
-        """Heading font tuple."""
+    def HEADING(cls) -> tkfont.Font | tuple:
+        """Heading font."""
+        cls._ensure_initialized()
+        return cls._font("HEADING", cls._family, 20, "bold")  # type: ignore[arg-type]
+
+    @classmethod
+    @property
+    def SUBHEADING(cls) -> tkfont.Font | tuple:
+        """Subheading font."""
         cls._ensure_initialized()
-        return (cls._family, 20, "bold")  # type: ignore[return-value]
+        return cls._font("SUBHEADING", cls._family, 16, "bold")  # type: ignore[arg-type]
 
     @classmethod
     @property
-    def SUBHEADING(cls) -> tuple[str, int, str]:
-        """Subheading font tuple."""
+    def BODY(cls) -> tkfont.Font | tuple:
+        """Body font."""
         cls._ensure_initialized()
-        return (cls._family, 16, "bold")  # type: ignore[return-value]
+        return cls._font("BODY", cls._family, 13)  # type: ignore[arg-type]
 
     @classmethod
     @property
-    def BODY(cls) -> tuple[str, int]:
-        """Body font tuple."""
+    def BODY_BOLD(cls) -> tkfont.Font | tuple:
+        """Bold body font."""
         cls._ensure_initialized()
-        return (cls._family, 13)  # type: ignore[return-value]
+        return cls._font("BODY_BOLD", cls._family, 13, "bold")  # type: ignore[arg-type]
 
     @classmethod
     @property
-    def BODY_BOLD(cls) -> tuple[str, int, str]:
-        """Bold body font tuple."""
+    def CAPTION(cls) -> tkfont.Font | tuple:
+        """Caption font."""
         cls._ensure_initialized()
-        return (cls._family, 13, "bold")  # type: ignore[return-value]
+        return cls._font("CAPTION", cls._family, 11)  # type: ignore[arg-type]
 
     @classmethod
     @property
-    def CAPTION(cls) -> tuple[str, int]:
-        """Caption font tuple."""
+    def DISPLAY(cls) -> tkfont.Font | tuple:
+        """Large display font for headline figures."""
         cls._ensure_initialized()
-        return (cls._family, 11)  # type: ignore[return-value]
+        return cls._font("DISPLAY", cls._family, 32, "bold")  # type: ignore[arg-type]
 
     @classmethod
     @property
-    def MONO(cls) -> tuple[str, int]:
-        """Monospace font tuple."""
+    def MONO(cls) -> tkfont.Font | tuple:
+        """Monospace font."""
         cls._ensure_initialized()
-        return (cls._family_mono, 12)  # type: ignore[return-value]
+        return cls._font("MONO", cls._family_mono, 12)  # type: ignore[arg-type]
 
     @classmethod
     @property
-    def MONO_SMALL(cls) -> tuple[str, int]:
-        """Small monospace font tuple."""
+    def MONO_SMALL(cls) -> tkfont.Font | tuple:
+        """Small monospace font."""
         cls._ensure_initialized()
-        return (cls._family_mono, 10)  # type: ignore[return-value]
+        return cls._font("MONO_SMALL", cls._family_mono, 10)  # type: ignore[arg-type]
 
 
 @dataclass(frozen=True)
@@ -236,6 +273,11 @@ class Theme:
             background=Colors.BG_SECONDARY,
             foreground=Colors.TEXT_PRIMARY,
         )
+        style.configure(
+            "CardMuted.TLabel",
+            background=Colors.BG_SECONDARY,
+            foreground=Colors.TEXT_MUTED,
+        )
         style.configure(
             "Success.TLabel",
             foreground=Colors.SUCCESS_TEXT,
@@ -276,6 +318,11 @@ class Theme:
             background=[("active", Colors.ACCENT_HOVER), ("pressed", Colors.ACCENT_HOVER)],
         )
 
+        style.configure(
+            "Danger.TButton",
+            foreground=Colors.DANGER_TEXT,
+        )
+
         style.configure(
             "Nav.TButton",
             background=Colors.BG_SECONDARY,
@@ -290,6 +337,22 @@ class Theme:
             foreground=[("active", Colors.TEXT_PRIMARY), ("selected", Colors.TEXT_PRIMARY)],
         )
 
+        # Text-only link button (hover color handled by Tk's button bindings)
+        style.configure(
+            "Link.TButton",
+            background=Colors.BG_SECONDARY,
+            foreground=Colors.ACCENT,
+            font=Fonts.BODY,
+            padding=0,
+            borderwidth=0,
+            relief="flat",
+        )
+        style.map(
+            "Link.TButton",
+            background=[("active", Colors.BG_SECONDARY), ("pressed", Colors.BG_SECONDARY)],
+            foreground=[("active", Colors.ACCENT_HOVER), ("pressed", Colors.ACCENT_HOVER)],
+        )
+
         style.configure(
             "NavActive.TButton",
             background=Colors.BG_TERTIARY,
@@ -98,7 +98,6 @@ def _create_mock_services():
     ]
 
     # Mock store with loss ledger
-    # The UI expects entries to have a 'year' field, so create mock objects
     mock_store = MagicMock()
 
     entry_2024 = LossLedgerYear(
@@ -107,7 +106,6 @@ def _create_mock_services():
         used_against_gains=Decimal("7422.22"),
         carryforward=Decimal("8234.56"),
     )
-    entry_2024.year = 2024  # Add year attribute for UI
 
     entry_2023 = LossLedgerYear(
         short_term_losses=Decimal("8900.00"),
@@ -115,7 +113,6 @@ def _create_mock_services():
         used_against_gains=Decimal("11000.00"),
         carryforward=Decimal("0.00"),
     )
-    entry_2023.year = 2023
 
     mock_store.get_loss_ledger.return_value = {
         2024: entry_2024,
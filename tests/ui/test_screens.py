@@ -122,6 +122,19 @@ class TestPositionsScreen:
         for ticker in expected_tickers:
             assert ticker in tickers_in_table, f"Ticker {ticker} not in table data"
 
+    def test_positions_refresh_keeps_rows_in_sync(self, app, main_window):
+        """Test that a repeat refresh leaves one tree row per position."""
+        main_window._show_screen("positions")
+        app.root.update()
+
+        screen = main_window._screens["positions"]
+        screen.refresh()
+        app.root.update()
+
+        tree_items = screen.table._tree.get_children()
+        assert len(tree_items) == len(screen.table._data)
+        assert set(tree_items) == {row["ticker"] for row in screen.table._data}
+
 
 class TestTradeQueueScreen:
     """Tests for the Trade Queue screen."""
@@ -168,6 +181,58 @@ class TestTradeQueueScreen:
         # Check for mock harvest opportunities
         assert "NVDA" in all_text_joined or "Pending" in all_text_joined
 
+    def test_trade_queue_filter_hides_rows(self, app, main_window):
+        """Test the filter detaches non-matching rows without dropping them."""
+        main_window._show_screen("harvest")
+        app.root.update()
+
+        screen = main_window._screens["harvest"]
+        tree = screen.table._tree
+        assert len(tree.get_children()) == len(screen.table._data) == 1
+
+        screen._filter_var.set("zzz")
+        screen._apply_filter()
+        assert tree.get_children() == ()
+        assert len(screen.table._data) == 1
+
+        screen._filter_var.set("nv")
+        screen._apply_filter()
+        assert len(tree.get_children()) == 1
+
+    def test_trade_queue_approve_scans_once(self, app, main_window):
+        """Test approving a queued trade runs a single scan."""
+        from decimal import Decimal
+
+        from tlh_agent.services import get_provider
+        from tlh_agent.services.trade_queue import TradeAction, TradeType
+
+        main_window._show_screen("harvest")
+        trade = main_window._trade_queue.add_trade(
+            trade_type=TradeType.INDEX_BUY,
+            action=TradeAction.BUY,
+            symbol="MSFT",
+            name="Microsoft",
+            shares=Decimal("10"),
+            current_price=Decimal("400"),
+            reason="Track S&P 500",
+        )
+        app.root.update()
+
+        screen = main_window._screens["harvest"]
+        item = next(
+            item
+            for item, row in screen.table._rows_by_item.items()
+            if row.get("_queued_trade") and row["_queued_trade"].id == trade.id
+        )
+        screen.table._tree.selection_set(item)
+
+        scan = get_provider().scanner.scan
+        scan.reset_mock()
+        screen._on_approve()
+        app.root.update()
+
+        assert scan.call_count == 1
+
 
 class TestWashCalendarScreen:
     """Tests for the Wash Sale Calendar screen."""
@@ -264,6 +329,67 @@ class TestTradeHistoryScreen:
         for text, found in results.items():
             assert found, f"Stat '{text}' not found in trade history"
 
+    def test_trade_history_filters_rows_and_totals(self, app, main_window):
+        """Test type and ticker filters narrow the table and the totals."""
+        from datetime import date
+        from decimal import Decimal
+
+        from tlh_agent.services import get_provider
+        from tlh_agent.services.portfolio import Trade
+
+        get_provider().portfolio.get_trade_history.return_value = [
+            Trade("t1", "AAPL", "sell", Decimal("10"), Decimal("150"), date(2024, 3, 1),
+                  Decimal("1500"), harvest_event_id="h1"),
+            Trade("t2", "VOO", "buy", Decimal("2"), Decimal("400"), date(2024, 3, 2),
+                  Decimal("800")),
+            Trade("t3", "AMZN", "sell", Decimal("1"), Decimal("100"), date(2024, 3, 3),
+                  Decimal("100")),
+        ]
+        main_window._show_screen("history")
+        app.root.update()
+        screen = main_window._screens["history"]
+
+        screen.type_var.set("Sell")
+        screen._apply_filters()
+        assert [row["ticker"] for row in screen.table._data] == ["AAPL", "AMZN"]
+        assert screen.stats_labels["total_sold"].cget("text") == "$1,600.00"
+        assert screen.stats_labels["total_bought"].cget("text") == "$0.00"
+
+        screen.ticker_var.set("aa")
+        screen._apply_filters()
+        assert [row["ticker"] for row in screen.table._data] == ["AAPL"]
+
+        # Backspacing widens the match set again
+        screen.ticker_var.set("a")
+        screen._apply_filters()
+        assert [row["ticker"] for row in screen.table._data] == ["AAPL", "AMZN"]
+
+        screen.type_var.set("Harvests Only")
+        screen.ticker_var.set("")
+        screen._apply_filters()
+        assert [row["ticker"] for row in screen.table._data] == ["AAPL"]
+
+    def test_trade_history_date_range_queries_provider(self, app, main_window):
+        """Test the date range is passed to the provider rather than filtered locally."""
+        from datetime import date, timedelta
+
+        from tlh_agent.services import get_provider
+
+        main_window._show_screen("history")
+        app.root.update()
+        screen = main_window._screens["history"]
+        get_trade_history = get_provider().portfolio.get_trade_history
+
+        screen.date_range_var.set("Last 7 Days")
+        screen.refresh()
+        filters = get_trade_history.call_args.kwargs["filters"]
+        assert filters.start_date == date.today() - timedelta(days=7)
+        assert filters.end_date is None
+        assert get_trade_history.call_args.kwargs["days"] == 8
+
+        screen._clear_filters()
+        assert get_trade_history.call_args.kwargs["filters"] is None
+
 
 class TestLossLedgerScreen:
     """Tests for the Loss Ledger screen."""
@@ -304,11 +430,53 @@ class TestLossLedgerScreen:
         app.root.update()
 
         screen = main_window._screens["ledger"]
-        all_texts = collect_all_texts(screen)
-        all_text_joined = " ".join(all_texts)
+
+        # Year rows live in a Treeview, not Labels
+        tree = screen.year_tree
+        years = [str(tree.item(item, "values")[0]) for item in tree.get_children()]
 
         # Check for year entries from mock data
-        assert "2024" in all_text_joined or "2023" in all_text_joined
+        assert "2024" in years or "2023" in years
+
+    def test_loss_ledger_renders_ledger_years(self, app, main_window):
+        """Test ledger rows are keyed by the store's year, newest first."""
+        main_window._show_screen("ledger")
+        app.root.update()
+
+        tree = main_window._screens["ledger"].year_tree
+        rows = [tree.item(item, "values") for item in tree.get_children()]
+
+        assert [row[0] for row in rows] == ["2024", "2023"]
+        assert rows[0][3] == "$15,656.78"
+
+    def test_loss_ledger_export_writes_years(self, app, main_window, tmp_path):
+        """Test exporting a non-empty ledger writes one CSV row per year."""
+        import time
+        from unittest.mock import patch
+
+        main_window._show_screen("ledger")
+        app.root.update()
+
+        screen = main_window._screens["ledger"]
+        path = tmp_path / "ledger.csv"
+        with (
+            patch(
+                "tlh_agent.ui.screens.loss_ledger.filedialog.asksaveasfilename",
+                return_value=str(path),
+            ),
+            patch("tlh_agent.ui.screens.loss_ledger.messagebox") as mock_messagebox,
+        ):
+            screen._on_export()
+            deadline = time.monotonic() + 5
+            while screen._export_in_progress and time.monotonic() < deadline:
+                app.root.update()
+                time.sleep(0.01)
+
+        mock_messagebox.showerror.assert_not_called()
+        mock_messagebox.showinfo.assert_called_once()
+        lines = path.read_text().splitlines()
+        assert lines[0].startswith("Year,")
+        assert [line.split(",")[0] for line in lines[1:]] == ["2024", "2023"]
 
 
 class TestSettingsScreen:
@@ -0,0 +1,54 @@
+"""Tests for background work helpers."""
+
+import time
+
+import pytest
+
+from tlh_agent.ui.background import run_in_background
+
+
+class FakeWidget:
+    """Stands in for a Tk widget, running after() callbacks on demand."""
+
+    def __init__(self) -> None:
+        self.pending: list = []
+
+    def after(self, ms: int, func) -> None:
+        self.pending.append(func)
+
+    def run_until_idle(self, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.pending:
+            if time.monotonic() > deadline:
+                raise TimeoutError("background work did not finish")
+            self.pending.pop(0)()
+            time.sleep(0.001)
+
+
+class TestRunInBackground:
+    """Tests for run_in_background."""
+
+    def test_calls_on_done_with_result(self) -> None:
+        """Test the result is delivered through the polling callback."""
+        widget = FakeWidget()
+        done = []
+
+        run_in_background(widget, lambda: 42, done.append)  # type: ignore[arg-type]
+        widget.run_until_idle()
+
+        assert len(done) == 1
+        assert done[0].result() == 42
+
+    def test_captures_exception(self) -> None:
+        """Test an exception in the worker is set on the future."""
+        widget = FakeWidget()
+        done = []
+
+        def fail() -> None:
+            raise OSError("disk full")
+
+        run_in_background(widget, fail, done.append)  # type: ignore[arg-type]
+        widget.run_until_idle()
+
+        with pytest.raises(OSError, match="disk full"):
+            done[0].result()
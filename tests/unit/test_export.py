@@ -0,0 +1,39 @@
+"""Tests for CSV export helpers."""
+
+import csv
+from pathlib import Path
+
+from tlh_agent.ui import export
+from tlh_agent.ui.export import write_csv
+
+
+class TestWriteCsv:
+    """Tests for write_csv."""
+
+    def test_writes_header_and_rows(self, tmp_path: Path) -> None:
+        """Test header and rows are written in order."""
+        path = tmp_path / "out.csv"
+
+        count = write_csv(path, ["Ticker", "Shares"], [("AAPL", 10), ("MSFT", 5)])
+
+        assert count == 2
+        with path.open(newline="") as f:
+            assert list(csv.reader(f)) == [["Ticker", "Shares"], ["AAPL", "10"], ["MSFT", "5"]]
+
+    def test_streams_generator_across_chunks(self, tmp_path: Path, monkeypatch) -> None:
+        """Test rows from a generator spanning several chunks are all written."""
+        monkeypatch.setattr(export, "CHUNK_ROWS", 3)
+        path = tmp_path / "out.csv"
+
+        count = write_csv(path, ["n"], ((i,) for i in range(7)))
+
+        assert count == 7
+        with path.open(newline="") as f:
+            assert [row[0] for row in csv.reader(f)][1:] == [str(i) for i in range(7)]
+
+    def test_empty_rows_writes_header_only(self, tmp_path: Path) -> None:
+        """Test exporting no rows still writes the header."""
+        path = tmp_path / "out.csv"
+
+        assert write_csv(path, ["Year"], []) == 0
+        assert path.read_text().strip() == "Year"
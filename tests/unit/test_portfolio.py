@@ -279,6 +279,19 @@ class TestPortfolioService:
         assert len(trades) == 1
         assert trades[0].ticker == "GOOGL"
 
+    def test_get_trade_history_date_bounds_inclusive(
+        self, portfolio_service: PortfolioService
+    ) -> None:
+        """Test that trades on the start and end dates are included."""
+        filters = TradeFilters(
+            start_date=date.today() - timedelta(days=30),
+            end_date=date.today() - timedelta(days=30),
+        )
+        trades = portfolio_service.get_trade_history(filters=filters)
+
+        # Only AAPL was filled exactly 30 days ago
+        assert [t.ticker for t in trades] == ["AAPL"]
+
     def test_get_alpaca_positions(
         self, portfolio_service: PortfolioService, mock_alpaca: MagicMock
     ) -> None:
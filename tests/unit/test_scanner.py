@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -370,6 +370,53 @@ class TestPortfolioScanner:
         with pytest.raises(ValueError, match="Queue item not found"):
             scanner.approve_harvest("invalid-id")
 
+    def test_approve_harvests_batch(
+        self, scanner: PortfolioScanner, temp_store: LocalStore
+    ) -> None:
+        """Test approving several queued harvests with a single save."""
+        opp = scanner.scan().opportunities[0]
+        items = [scanner.add_to_queue(opp) for _ in range(3)]
+
+        with patch.object(temp_store, "_save", wraps=temp_store._save) as save:
+            count = scanner.approve_harvests([item.id for item in items])
+
+        assert count == 3
+        save.assert_called_once()
+        assert [i.status for i in temp_store.get_harvest_queue()] == ["approved"] * 3
+
+    def test_reject_harvests_batch(
+        self, scanner: PortfolioScanner, temp_store: LocalStore
+    ) -> None:
+        """Test rejecting only the given queued harvests."""
+        opp = scanner.scan().opportunities[0]
+        items = [scanner.add_to_queue(opp) for _ in range(3)]
+
+        count = scanner.reject_harvests([items[0].id, items[2].id])
+
+        assert count == 2
+        statuses = [i.status for i in temp_store.get_harvest_queue()]
+        assert statuses == ["rejected", "pending", "rejected"]
+
+    def test_approve_harvests_empty(
+        self, scanner: PortfolioScanner, temp_store: LocalStore
+    ) -> None:
+        """Test batch approve with no IDs is a no-op that skips the save."""
+        with patch.object(temp_store, "_save") as save:
+            assert scanner.approve_harvests([]) == 0
+        save.assert_not_called()
+
+    def test_approve_harvests_invalid_id(
+        self, scanner: PortfolioScanner, temp_store: LocalStore
+    ) -> None:
+        """Test batch approve with an unknown ID raises and changes nothing."""
+        opp = scanner.scan().opportunities[0]
+        items = [scanner.add_to_queue(opp) for _ in range(2)]
+
+        with pytest.raises(ValueError, match="Queue item not found"):
+            scanner.approve_harvests([items[0].id, "invalid-id", items[1].id])
+
+        assert [i.status for i in temp_store.get_harvest_queue()] == ["pending"] * 2
+
     def test_update_rules(self, scanner: PortfolioScanner) -> None:
         """Test updating scanner rules."""
         new_rules = HarvestRules(min_loss_usd=Decimal("500"))
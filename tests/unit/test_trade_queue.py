@@ -499,3 +499,54 @@ class TestTradeQueueService:
         total = service.get_total_tax_impact()
 
         assert total == Decimal("-525")
+
+    def test_listeners_notified_on_change(self, service: TradeQueueService) -> None:
+        """Test listeners fire on each queue change and can be removed."""
+        calls = []
+
+        def listener() -> None:
+            calls.append(len(service.get_all_trades()))
+
+        service.add_listener(listener)
+
+        trade = service.add_trade(
+            trade_type=TradeType.INDEX_BUY,
+            action=TradeAction.BUY,
+            symbol="MSFT",
+            name="Microsoft",
+            shares=Decimal("10"),
+            current_price=Decimal("400"),
+            reason="Track S&P 500",
+        )
+        service.approve_trade(trade.id)
+        service.approve_trade(trade.id)  # Already approved, no change
+        service.remove_trade(trade.id)
+        assert calls == [1, 1, 0]
+
+        service.remove_listener(listener)
+        service.clear_queue()
+        assert calls == [1, 1, 0]
+
+    def test_failing_listener_does_not_break_changes(self, service: TradeQueueService) -> None:
+        """Test a raising listener is logged and later listeners still run."""
+        calls = []
+
+        def failing_listener() -> None:
+            raise RuntimeError("listener failed")
+
+        service.add_listener(failing_listener)
+        service.add_listener(lambda: calls.append(len(service.get_all_trades())))
+
+        trade = service.add_trade(
+            trade_type=TradeType.INDEX_BUY,
+            action=TradeAction.BUY,
+            symbol="MSFT",
+            name="Microsoft",
+            shares=Decimal("10"),
+            current_price=Decimal("400"),
+            reason="Track S&P 500",
+        )
+        service.approve_trade(trade.id)
+
+        assert service.get_trade(trade.id).status == TradeStatus.APPROVED
+        assert calls == [1, 1]